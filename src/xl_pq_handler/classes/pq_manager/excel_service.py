@@ -1,11 +1,17 @@
 # excel_service.py
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
 import xlwings as xw
 from .utils import get_logger
 from .models import PowerQueryScript  # Only for type hinting
 
 logger = get_logger(__name__)
 
+try:
+    import pythoncom  # Ships with pywin32 on Windows
+except ImportError:  # Non-Windows: xlwings doesn't go through COM
+    pythoncom = None
+
 
 class ExcelQueryService:
     """
@@ -15,6 +21,23 @@ class ExcelQueryService:
     def __init__(self, hwnd:  int | None = None) -> None:
         self.hwnd = hwnd
 
+    @staticmethod
+    @contextmanager
+    def com_apartment() -> Iterator[None]:
+        """
+        Initializes COM for the calling worker thread and uninitializes
+        it on exit, so proxies created on short-lived threads don't keep
+        server-side references pinned. No-op where COM isn't available.
+        """
+        if pythoncom is None:
+            yield
+            return
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        try:
+            yield
+        finally:
+            pythoncom.CoUninitialize()
+
     def _get_excel_instance(self) -> xw.App:
         """
         Returns an xlwings App instance:
@@ -43,11 +66,22 @@ class ExcelQueryService:
         except Exception as e:
             raise RuntimeError(f"Error locating Excel instance: {e}")
 
-    def _get_wb_api_from_path(self, file_path: str) -> Any:
-        """(Helper) Opens a workbook and returns its API object."""
-        app = xw.App(visible=False)
+    def _get_wb_api_from_path(self, file_path: str, read_only: bool = False) -> Any:
+        """
+        (Helper) Opens a workbook and returns its API object.
+        With read_only, skips the write lock, external link refresh and
+        alerts; writable opens keep Excel's default behaviour.
+        """
+        # add_book=False: don't spin up a throwaway blank workbook
+        app = xw.App(visible=False, add_book=False)
         try:
-            wb = app.books.open(file_path)
+            if read_only:
+                app.display_alerts = False
+                app.screen_updating = False
+                wb = app.books.open(
+                    file_path, update_links=False, read_only=True)
+            else:
+                wb = app.books.open(file_path)
             return wb.api, app, wb  # Return all to be managed
         except Exception as e:
             app.quit()
@@ -127,8 +161,9 @@ class ExcelQueryService:
                 logger.info(
                     f"Reading queries from provided workbook: {wb_api.Name}")
             elif file_path:
+                # Reading queries never writes, so open without the lock
                 wb_api, app_to_quit, wb_to_close = self._get_wb_api_from_path(
-                    file_path)
+                    file_path, read_only=True)
                 logger.info(f"Reading queries from {file_path}...")
             else:
                 # Fallback to active workbook
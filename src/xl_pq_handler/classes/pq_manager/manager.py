@@ -9,7 +9,7 @@ from .storage import PQFileStore
 from .excel_service import ExcelQueryService
 from .dependencies import DependencyResolver
 from .parser import ExcelMCodeParser
-from .utils import get_logger
+from .utils import get_logger, sanitize_name
 
 logger = get_logger(__name__)
 
@@ -64,14 +64,9 @@ class PQManager:
         created_files = []
         for q in query_dicts:
             try:
-                # Sanitize name for file
-                safe_name = "".join(c for c in q["name"] if c.isalnum()
-                                    or c in (' ', '_', '-')).rstrip()
-                # Sanitize category for folder
-                safe_category = "".join(c for c in category if c.isalnum()
-                                        or c in (' ', '_', '-')).rstrip()
-                if not safe_category:
-                    safe_category = "Uncategorized"
+                # Sanitize name for file, category for folder
+                safe_name = sanitize_name(q["name"])
+                safe_category = sanitize_name(category, "Uncategorized")
 
                 target_dir = os.path.join(
                     self.store.root, "functions", safe_category)
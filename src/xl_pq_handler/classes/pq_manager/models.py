@@ -1,5 +1,6 @@
 # models.py
 import os
+import threading
 from typing import List, Optional, Dict, Any
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -87,7 +88,19 @@ class PowerQueryScript(BaseModel):
                 f"{target_path} already exists. Set overwrite=True."
             )
 
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        with open(target_path, "w", encoding="utf-8") as f:
-            f.write(self.to_file_content())
+        target_dir = os.path.dirname(target_path)
+        os.makedirs(target_dir, exist_ok=True)
+        # Render once, write it in one call to a temp file in the same
+        # folder, then swap it in so readers never see a half-written file
+        content = self.to_file_content()
+        # (pid + thread id keep concurrent savers off each other's temp file)
+        tmp_path = f"{target_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         logger.info(f"Saved script to: {target_path}")
@@ -65,24 +65,28 @@ class PQFileStore:
     def build_index(self) -> str:
         """Build or refresh the JSON index of all .pq files."""
         logger.info(f"Building index from file system root: {self.root}")
-        metadata_list: List[Dict] = []
+        metas: List[PowerQueryMetadata] = []
         for dirpath, _, files in os.walk(self.root):
             for fn in files:
                 if fn.lower().endswith(".pq"):
                     path = os.path.join(dirpath, fn)
                     try:
                         script = PowerQueryScript.from_file(path)
-                        metadata_list.append(script.meta.model_dump())
+                        metas.append(script.meta)
                     except Exception as e:
                         logger.warning(f"Failed to parse {path}: {e}")
 
-        metadata_list.sort(key=lambda r: (
-            r["category"].lower(), r["name"].lower()))
+        metas.sort(key=lambda m: (m.category.lower(), m.name.lower()))
 
         with open(self.index_path, "w", encoding="utf-8") as f:
-            json.dump(metadata_list, f, indent=2, ensure_ascii=False)
-
-        self.load_index(force_reload=True)
+            json.dump([m.model_dump() for m in metas], f,
+                      indent=2, ensure_ascii=False)
+
+        # The walk already produced validated metadata, so fill the cache
+        # directly instead of re-reading and re-validating index.json
+        self._index = {m.name.lower(): m for m in metas}
+        self._index_load_time = time.time()
+        logger.info(f"Loaded {len(self._index)} items into index cache.")
         return self.index_path
 
     def get_metadata_by_name(self, name: str) -> Optional[PowerQueryMetadata]:
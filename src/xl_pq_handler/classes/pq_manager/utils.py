@@ -1,5 +1,9 @@
 # utils.py
 import logging
+import re
+
+# Anything that isn't a word char, space or hyphen is dropped from file names
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w \-]")
 
 
 def get_logger(name: str):
@@ -9,3 +13,8 @@ def get_logger(name: str):
         format="[%(levelname)s] (%(name)s) %(message)s"
     )
     return logging.getLogger(name)
+
+
+def sanitize_name(name: str, default: str = "") -> str:
+    """Strips characters unsafe for a file/folder name; `default` if none remain."""
+    return _UNSAFE_NAME_CHARS.sub("", name).rstrip() or default
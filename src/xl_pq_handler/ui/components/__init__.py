@@ -1 +1,3 @@
 from .codeview import CTkCodeView
+from .virtual_list import CTkVirtualCheckList
+from .text_runs import insert_runs
@@ -0,0 +1,20 @@
+# ui_text_runs.py
+from typing import Iterable, Tuple
+import customtkinter as ctk
+
+
+def insert_runs(box: ctk.CTkTextbox, runs: Iterable[Tuple[str, tuple]]):
+    """
+    Appends (text, tags) runs to a textbox (or CTkCodeView). The public
+    `insert` takes one text/tags pair per call, so consecutive runs that
+    share tags are merged into a single call.
+    """
+    pending, pending_tags = [], None
+    for text, tags in runs:
+        if pending and tags != pending_tags:
+            box.insert("end", "".join(pending), pending_tags)
+            pending = []
+        pending.append(text)
+        pending_tags = tags
+    if pending:
+        box.insert("end", "".join(pending), pending_tags)
@@ -0,0 +1,219 @@
+# ui_virtual_list.py
+import tkinter as tk
+import customtkinter as ctk
+from typing import Callable, List, Sequence
+from ..theme import SoP
+
+
+class _PoolRow:
+    """A recycled row: checkbox + name button living in a canvas window."""
+
+    def __init__(self, frame, checkbox, var, button, window):
+        self.frame = frame
+        self.checkbox = checkbox
+        self.var = var  # Owned by the row; synced from the checked list
+        self.button = button
+        self.window = window
+        self.pos: int | None = None    # Position in the shown order
+        self.index: int | None = None  # Item index currently bound
+
+
+class CTkVirtualCheckList(ctk.CTkFrame):
+    """
+    A scrollable list of (checkbox, name) rows that only materializes
+    the rows inside the viewport. Row widgets are pooled and rebound
+    on scroll, so the widget count stays O(viewport), not O(items).
+    Check state lives in a plain list of bools, not N Tk variables.
+    """
+
+    def __init__(self, master, on_item_click: Callable[[int], None] | None = None,
+                 on_item_toggle: Callable[[int, bool], None] | None = None,
+                 row_height: int = 34, overscan: int = 4,
+                 list_bg: str = SoP["FRAME"], **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+
+        self.on_item_click = on_item_click
+        self.on_item_toggle = on_item_toggle  # Fired on user checkbox clicks
+        self.overscan = overscan
+        self._row_height = row_height
+        self._row_px = round(self._apply_widget_scaling(row_height))
+
+        self._labels: List[str] = []
+        self._checked: List[bool] = []
+        self._order: List[int] = []  # Item indices shown, in display order
+        self._pool: List[_PoolRow] = []
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(
+            self, bg=list_bg, highlightthickness=0, bd=0,
+            yscrollincrement=self._row_px)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        self.scrollbar = ctk.CTkScrollbar(
+            self, orientation="vertical", command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._bind_wheel(self.canvas)
+
+    # --- Public API ---
+
+    def set_items(self, labels: Sequence[str], checked: List[bool]):
+        """
+        Replaces the full item list and shows every item. `checked` is
+        shared, not copied: user clicks write into it, and callers that
+        change it directly should call sync_checks() afterwards.
+        """
+        self._labels = list(labels)
+        self._checked = checked
+        self.set_order(range(len(self._labels)))
+
+    def sync_checks(self):
+        """Pushes the checked list into the rows currently in view."""
+        for row in self._pool:
+            if row.pos is not None and row.var.get() != self._checked[row.index]:
+                row.var.set(self._checked[row.index])
+
+    def set_order(self, order: Sequence[int]):
+        """Shows only the given item indices (e.g. a filter result)."""
+        self._order = list(order)
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, len(self._order) * self._row_px))
+        self.canvas.yview_moveto(0)
+        # Positions changed, so every pooled row must be rebound
+        for row in self._pool:
+            self._hide_row(row)
+        self._render()
+
+    @property
+    def visible_indices(self) -> List[int]:
+        """Item indices that pass the current order/filter (read-only)."""
+        return self._order
+
+    # --- Rendering ---
+
+    def _render(self):
+        """Binds pooled rows to the positions intersecting the viewport."""
+        total = len(self._order)
+        row_px = self._row_px
+        top = int(self.canvas.canvasy(0) // row_px)
+        height = max(self.canvas.winfo_height(), row_px)
+        first = max(0, top - self.overscan)
+        last = min(total, top + height // row_px + 1 + self.overscan)
+
+        self._ensure_pool(last - first)
+        pool_size = len(self._pool)
+        if not pool_size:
+            return
+
+        live = set()
+        for pos in range(first, last):
+            slot = pos % pool_size  # Rows keep their slot while in view
+            live.add(slot)
+            row = self._pool[slot]
+            if row.pos != pos:
+                self._bind_row(row, pos)
+
+        for slot, row in enumerate(self._pool):
+            if slot not in live and row.pos is not None:
+                self._hide_row(row)
+
+    def _bind_row(self, row: _PoolRow, pos: int):
+        index = self._order[pos]
+        if row.index != index:
+            row.index = index
+            row.button.configure(text=self._labels[index])
+        if row.var.get() != self._checked[index]:
+            row.var.set(self._checked[index])
+        self.canvas.coords(row.window, 0, pos * self._row_px)
+        if row.pos is None:
+            self.canvas.itemconfigure(row.window, state="normal")
+        row.pos = pos
+
+    def _hide_row(self, row: _PoolRow):
+        if row.pos is not None:
+            self.canvas.itemconfigure(row.window, state="hidden")
+            row.pos = None
+
+    def _ensure_pool(self, count: int):
+        """Grows the row pool to at least `count` rows."""
+        if count <= len(self._pool):
+            return
+        while len(self._pool) < count:
+            self._pool.append(self._create_row())
+        # Slot mapping depends on the pool size, so rebind everything
+        for row in self._pool:
+            self._hide_row(row)
+
+    def _create_row(self) -> _PoolRow:
+        frame = ctk.CTkFrame(
+            self.canvas, fg_color="transparent", height=self._row_height)
+        frame.grid_columnconfigure(1, weight=1)
+
+        var = tk.BooleanVar(value=False)
+        checkbox = ctk.CTkCheckBox(
+            frame, text="", variable=var,
+            fg_color=SoP["ACCENT"], hover_color=SoP["ACCENT_HOVER"],
+            width=30
+        )
+        checkbox.grid(row=0, column=0, padx=5)
+
+        button = ctk.CTkButton(
+            frame, text="",
+            fg_color="transparent",
+            text_color=SoP["TEXT"],
+            hover_color=SoP["EDITOR"],
+            anchor="w"
+        )
+        button.grid(row=0, column=1, sticky="ew")
+
+        window = self.canvas.create_window(
+            0, 0, window=frame, anchor="nw", state="hidden",
+            width=self.canvas.winfo_width(), height=self._row_px)
+
+        row = _PoolRow(frame, checkbox, var, button, window)
+        button.configure(command=lambda r=row: self._on_row_click(r))
+        checkbox.configure(command=lambda r=row: self._on_row_toggle(r))
+        for widget in (frame, checkbox, button):
+            self._bind_wheel(widget)
+        return row
+
+    # --- Events ---
+
+    def _on_row_click(self, row: _PoolRow):
+        if self.on_item_click and row.index is not None:
+            self.on_item_click(row.index)
+
+    def _on_row_toggle(self, row: _PoolRow):
+        if row.index is None:
+            return
+        value = bool(row.var.get())
+        self._checked[row.index] = value
+        if self.on_item_toggle:
+            self.on_item_toggle(row.index, value)
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _on_canvas_configure(self, event):
+        for row in self._pool:
+            self.canvas.itemconfigure(row.window, width=event.width)
+        self._render()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_mousewheel)  # Windows/macOS
+        widget.bind("<Button-4>", self._on_mousewheel)    # Linux up
+        widget.bind("<Button-5>", self._on_mousewheel)    # Linux down
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self.canvas.yview_scroll(step, "units")
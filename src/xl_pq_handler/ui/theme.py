@@ -1,6 +1,11 @@
 """
 Defines the "Shades of Purple" (SoP) color theme.
 """
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
+import customtkinter as ctk
 
 SoP = {
     "BG": "#2d2b55",         # Darkest background
@@ -14,3 +19,28 @@ SoP = {
     "TEXT_SUPER_DIM": "#535353",
     "TREE_FIELD": "#343261"  # Treeview row background,
 }
+
+
+@lru_cache(maxsize=None)
+def get_font(size: Optional[int] = None, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Returns a shared CTkFont for (size, weight), created on first use.
+    Must be called after the Tk root exists.
+    """
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+# Shared look of the transparent, accent-outlined action buttons
+OUTLINE_BUTTON_STYLE = MappingProxyType({
+    "fg_color": "transparent",
+    "border_width": 1,
+    "border_color": SoP["ACCENT"],
+    "hover_color": SoP["TREE_FIELD"],
+    "text_color": SoP["ACCENT"],
+    "height": 40,
+})
+
+
+def outline_button(parent, **overrides) -> ctk.CTkButton:
+    """Creates a CTkButton in the outline style; kwargs override it."""
+    return ctk.CTkButton(parent, **{**OUTLINE_BUTTON_STYLE, **overrides})
@@ -106,7 +106,7 @@ class PQManagerUI:
             refresh_callback=self.refresh_all_views
         )
 
-        # Place views in the grid, they will be hidden/shown by select_view
+        # Stack views in the same grid cell; select_view raises the active one
         for view in self.views.values():
             view.grid(row=0, column=0, sticky="nsew", padx=20, pady=15)
 
@@ -121,31 +121,31 @@ class PQManagerUI:
         self.nav_btn_extract.configure(
             fg_color="transparent", text_color=SoP["TEXT_DIM"])
 
-        # Hide all views
-        for view in self.views.values():
-            view.grid_remove()
-
-        # Show the selected view and highlight the button
+        # Raise the selected view (stacking change only, no re-layout)
+        # and highlight the button
         if view_name == "library":
-            self.views["library"].grid()
+            self.views["library"].tkraise()
             self.nav_btn_library.configure(
                 fg_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"])
         elif view_name == "create":
-            self.views["create"].grid()
+            self.views["create"].tkraise()
             self.nav_btn_create.configure(
                 fg_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"])
         elif view_name == "extract":
-            self.views["extract"].grid()
+            self.views["extract"].tkraise()
+            self.views["extract"].on_activate()
             self.nav_btn_extract.configure(
                 fg_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"])
 
-    def refresh_all_views(self):
+    def refresh_all_views(self, rebuild_index: bool = True):
         """
         Callback function to rebuild the index and refresh all views
-        that depend on it.
+        that depend on it. Callers that have just rebuilt the index
+        pass rebuild_index=False to skip a second walk of the tree.
         """
         try:
-            self.manager.build_index()
+            if rebuild_index:
+                self.manager.build_index()
             # Tell LibraryView to reload its data
             self.views["library"].refresh_data()
             # Tell CreateView to clear its form
@@ -159,4 +159,7 @@ class PQManagerUI:
 
     def _on_close(self):
         """Handle window close event."""
+        for view in self.views.values():
+            if hasattr(view, "close"):
+                view.close()
         self.root.destroy()
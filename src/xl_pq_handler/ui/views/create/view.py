@@ -8,6 +8,7 @@ from typing import Callable
 
 from ....classes.pq_manager import PQManager
 from ....classes.pq_manager.models import PowerQueryScript, PowerQueryMetadata
+from ....classes.pq_manager.utils import sanitize_name
 from ...theme import SoP
 from ...components.codeview import CTkCodeView
 
@@ -109,6 +110,17 @@ class CreateView(ctk.CTkFrame):
         self.create_save_btn.grid(
             row=2, column=0, columnspan=2, sticky="e", pady=20, padx=0)
 
+        # field -> (widget, args for .get()); entries take no index args
+        self._form_fields = {
+            "name": (self.create_entry_name, ()),
+            "category": (self.create_entry_category, ()),
+            "version": (self.create_entry_version, ()),
+            "tags": (self.create_entry_tags, ()),
+            "deps": (self.create_entry_deps, ()),
+            "desc": (self.create_text_desc, ("1.0", "end")),
+            "body": (self.create_text_body, ("1.0", "end")),
+        }
+
     def _on_tab_change(self):
         """Called when the 'Write' or 'Preview' tab is clicked."""
         selected_tab = self.body_tabview.get()
@@ -120,33 +132,28 @@ class CreateView(ctk.CTkFrame):
 
     def clear_form(self):
         """Called by the main app after a successful refresh."""
-        self.create_entry_name.delete(0, "end")
-        self.create_entry_category.delete(0, "end")
-        self.create_entry_version.delete(0, "end")
-        self.create_entry_tags.delete(0, "end")
-        self.create_entry_deps.delete(0, "end")
-        self.create_text_desc.delete("1.0", "end")
-        self.create_text_body.delete("1.0", "end")
+        for widget, args in self._form_fields.values():
+            widget.delete(args[0] if args else 0, "end")
 
     def _threaded_create_new_pq(self):
-        body = self.create_text_body.get("1.0", "end").strip()
-        name = self.create_entry_name.get().strip()
-        if not name or not body:
+        # Read and strip every widget exactly once
+        vals = {key: widget.get(*args).strip()
+                for key, (widget, args) in self._form_fields.items()}
+        if not vals["name"] or not vals["body"]:
             messagebox.showerror("Error", "Name and Query Body are required.")
             return
 
-        category = self.create_entry_category.get().strip() or "Uncategorized"
-        version = self.create_entry_version.get().strip() or "1.0"
-        desc = self.create_text_desc.get("1.0", "end").strip()
+        vals["category"] = vals["category"] or "Uncategorized"
+        vals["version"] = vals["version"] or "1.0"
 
         def split_csv(csv_str):
             return [tag.strip() for tag in csv_str.split(",") if tag.strip()]
-        tags = split_csv(self.create_entry_tags.get())
-        deps = split_csv(self.create_entry_deps.get())
+        vals["tags"] = split_csv(vals["tags"])
+        vals["deps"] = split_csv(vals["deps"])
 
         threading.Thread(
             target=self._create_new_pq,
-            args=(name, body, category, desc, tags, deps, version),
+            kwargs=vals,
             daemon=True
         ).start()
 
@@ -158,12 +165,8 @@ class CreateView(ctk.CTkFrame):
             # NEW API LOGIC: Construct the script object and save it.
 
             # 1. Determine safe path (logic from old handler)
-            safe_name = "".join(c for c in name if c.isalnum()
-                                or c in (' ', '_', '-')).rstrip()
-            safe_category = "".join(
-                c for c in category if c.isalnum() or c in (' ', '_', '-')).rstrip()
-            if not safe_category:
-                safe_category = "Uncategorized"
+            safe_name = sanitize_name(name)
+            safe_category = sanitize_name(category, "Uncategorized")
 
             # Use the manager's root path
             target_dir = os.path.join(
@@ -192,7 +195,8 @@ class CreateView(ctk.CTkFrame):
             # 5. Use callbacks to update UI on the main thread
             self.master.after(0, lambda: messagebox.showinfo(
                 "Success", f"Query '{name}' was created successfully."))
-            self.master.after(0, self.refresh_callback)
+            self.master.after(
+                0, lambda: self.refresh_callback(rebuild_index=False))
             self.master.after(0, self.switch_to_library_callback)
 
         except Exception as e:
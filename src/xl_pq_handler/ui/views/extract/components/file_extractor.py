@@ -2,9 +2,8 @@ import customtkinter as ctk
 from typing import Callable
 import tkinter as tk
 from tkinter import filedialog
-import os
 
-from ....theme import SoP
+from ....theme import SoP, get_font, outline_button
 
 
 class FileExtractor(ctk.CTkFrame):
@@ -16,6 +15,10 @@ class FileExtractor(ctk.CTkFrame):
 
         self.extract_callback = extract_callback
         self.selected_file_path = ""
+        # Last applied widget state, so repeat picks skip no-op configures
+        self._last_label_text = "No file selected."
+        self._last_btn_state = {"state": "disabled",
+                                "text": "Get Queries from File"}
         self._build_widgets()
 
     def _build_widgets(self):
@@ -24,7 +27,7 @@ class FileExtractor(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="From Files",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=SoP["ACCENT_HOVER"]
         )
         title.grid(row=0, column=0, sticky="ew")
@@ -35,11 +38,9 @@ class FileExtractor(ctk.CTkFrame):
         file_frame.grid_columnconfigure(0, weight=0)
         file_frame.grid_columnconfigure(1, weight=1)
 
-        self.select_file_btn = ctk.CTkButton(
-            file_frame, text="📁 Select File...", height=40,
-            command=self._select_excel_file,
-            fg_color="transparent", border_width=1, border_color=SoP["ACCENT"],
-            hover_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"]
+        self.select_file_btn = outline_button(
+            file_frame, text="📁 Select File...",
+            command=self._select_excel_file
         )
         self.select_file_btn.grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
@@ -50,29 +51,50 @@ class FileExtractor(ctk.CTkFrame):
         )
         self.file_label.grid(row=0, column=1, sticky="ew")
 
-        self.extract_btn = ctk.CTkButton(
-            file_frame, text="Get Queries from File", height=40,
+        self.extract_btn = outline_button(
+            file_frame, text="Get Queries from File",
             command=self._on_extract,
-            fg_color="transparent", border_width=1, border_color=SoP["ACCENT"],
-            hover_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"], state="disabled"
+            # CTk swaps the text colour with the state on its own
+            text_color_disabled=SoP["TEXT_DIM"], state="disabled"
         )
         self.extract_btn.grid(row=1, column=0, columnspan=2,
                               sticky="ew", pady=(10, 0))
 
     def _select_excel_file(self):
+        # Let the click handler return (and the button repaint) before the
+        # modal picker takes over; Tk dialogs must stay on the Tk thread.
+        self.after_idle(self._ask_excel_file)
+
+    def _ask_excel_file(self):
         path = filedialog.askopenfilename(
+            parent=self,
             title="Select Excel File",
             filetypes=(("Excel Files", "*.xlsx;*.xlsm;*.xlsb"), ("All Files", "*.*")))
+        self._apply_selection(path)
+
+    def _apply_selection(self, path: str):
+        """Updates the label and extract button for the picked file."""
+        self.selected_file_path = path or ""
         if path:
-            self.selected_file_path = path
-            self.file_label.configure(text=os.path.basename(path))
-            self.extract_btn.configure(
-                state="normal", text_color=SoP["ACCENT"])
+            # Tk returns '/' paths; backslashes are handled too
+            self._set_label(path.rpartition("/")[2].rpartition("\\")[2])
+            self._set_extract_btn(state="normal")
         else:
-            self.selected_file_path = ""
-            self.file_label.configure(text="No file selected.")
-            self.extract_btn.configure(
-                state="disabled", text_color=SoP["TEXT_DIM"])
+            self._set_label("No file selected.")
+            self._set_extract_btn(state="disabled")
+
+    def _set_label(self, text: str):
+        if text != self._last_label_text:
+            self._last_label_text = text
+            self.file_label.configure(text=text)
+
+    def _set_extract_btn(self, **kwargs):
+        """Reconfigures the extract button with only the options that changed."""
+        changed = {k: v for k, v in kwargs.items()
+                   if self._last_btn_state.get(k) != v}
+        if changed:
+            self._last_btn_state.update(changed)
+            self.extract_btn.configure(**changed)
 
     def _on_extract(self):
         if not self.selected_file_path:
@@ -83,9 +105,8 @@ class FileExtractor(ctk.CTkFrame):
         """Disables/Enables buttons during operation."""
         state = "disabled" if is_busy else "normal"
         text = "Reading..." if is_busy else "Get Queries from File"
-        self.extract_btn.configure(state=state, text=text)
+        # Only re-enable extracting if a file is selected
+        ready = not is_busy and self.selected_file_path
+        self._set_extract_btn(
+            state="normal" if ready else "disabled", text=text)
         self.select_file_btn.configure(state=state)
-        if not is_busy and self.selected_file_path:  # Re-enable color if file selected
-            self.extract_btn.configure(text_color=SoP["ACCENT"])
-        elif not is_busy:
-            self.extract_btn.configure(text_color=SoP["TEXT_DIM"])
@@ -1,9 +1,22 @@
+import threading
+from collections import deque
 import customtkinter as ctk
 
 from ....theme import SoP
 
 
 class LogViewer(ctk.CTkFrame):
+    # Oldest lines are trimmed once the log grows past MAX + SLACK lines
+    MAX_LOG_LINES = 2000
+    LOG_TRIM_SLACK = 200
+    # While a job runs or lines are queued, the UI thread drains the
+    # queue on this tick, at most BATCH per tick
+    LOG_POLL_MS = 50
+    LOG_DRAIN_BATCH = 512
+    # Tags are a closed set, so their insert tuples are built once
+    _TAG_TUPLES = {"accent": ("accent",), "accent_bold": ("accent_bold",),
+                   "error": ("error",), None: ()}
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
 
@@ -24,17 +37,93 @@ class LogViewer(ctk.CTkFrame):
             "accent_bold", foreground=SoP["ACCENT_HOVER"])
         self.log_textbox.tag_config("error", foreground="#FF5555")
 
+        # Pending (message, tag) pairs. Workers only append here (deque
+        # appends are thread-safe); the widget is touched on the UI thread.
+        self._log_buf: deque[tuple[str, str | None]] = deque()
+        self._poll_id = None  # Pending drain tick, if any
+        self._jobs = 0  # Worker jobs that may still log (UI thread only)
+
+    def set_max_lines(self, max_lines: int):
+        """Changes the line cap for this viewer and trims right away."""
+        self.MAX_LOG_LINES = max(1, int(max_lines))
+        self.log_textbox.configure(state="normal")
+        self._trim_log()
+        self.log_textbox.configure(state="disabled")
+
     def clear_log(self):
+        self._log_buf.clear()
         self.log_textbox.configure(state="normal")
         self.log_textbox.delete("1.0", "end")
         self.log_textbox.configure(state="disabled")
 
     def append_log(self, message, tag=None):
-        # No need for after() here, parent view will call this from main thread
+        """
+        Queues a message. Safe to call from worker threads between
+        begin_job() and end_job(); the UI thread writes queued bursts
+        to the textbox on its next tick.
+        """
+        self._log_buf.append((message, tag))
+        if threading.current_thread() is threading.main_thread():
+            self._ensure_polling()
+
+    def begin_job(self):
+        """UI THREAD: a worker may log from now on; keep draining."""
+        self._jobs += 1
+        self._ensure_polling()
+
+    def end_job(self):
+        """UI THREAD: a worker is done logging; drain what's left, then idle."""
+        self._jobs = max(0, self._jobs - 1)
+        self._ensure_polling()
+
+    def destroy(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        super().destroy()
+
+    def _ensure_polling(self):
+        if self._poll_id is None:
+            self._poll_id = self.after(self.LOG_POLL_MS, self._drain_log)
+
+    def _drain_log(self):
+        """UI-thread tick: flushes whatever the workers queued."""
+        self._poll_id = None
+        if self._log_buf:
+            self._flush_log()
+        # Stop ticking once nothing is queued and no worker can add more
+        if self._log_buf or self._jobs:
+            self._ensure_polling()
+
+    def _flush_log(self):
+        """Drains the buffer with one insert per run of same-tag messages."""
+        # Group consecutive messages sharing a tag
+        groups: list[tuple[str | None, list[str]]] = []
+        for _ in range(min(len(self._log_buf), self.LOG_DRAIN_BATCH)):
+            message, tag = self._log_buf.popleft()
+            if groups and groups[-1][0] == tag:
+                groups[-1][1].append(message)
+            else:
+                groups.append((tag, [message]))
+
+        # Only follow the tail if the user hasn't scrolled up to read
+        follow = self.log_textbox.yview()[1] >= 1.0
+
         self.log_textbox.configure(state="normal")
-        if tag:
-            self.log_textbox.insert("end", message, (tag,))
-        else:
-            self.log_textbox.insert("end", message)
-        self.log_textbox.see("end")
+        tag_tuples = self._TAG_TUPLES
+        for tag, parts in groups:
+            tags = tag_tuples.get(tag)
+            if tags is None:
+                tags = (tag,) if tag else ()
+            self.log_textbox.insert("end", "".join(parts), tags)
+        self._trim_log()
+        if follow:
+            # Jump by fraction; see() would measure lines to the index
+            self.log_textbox.yview_moveto(1.0)
         self.log_textbox.configure(state="disabled")
+
+    def _trim_log(self):
+        """Drops the oldest lines in a single delete when over the cap."""
+        line_count = int(self.log_textbox.index("end-1c").split(".")[0])
+        if line_count > self.MAX_LOG_LINES + self.LOG_TRIM_SLACK:
+            self.log_textbox.delete(
+                "1.0", f"end-{self.MAX_LOG_LINES}l linestart")
@@ -2,13 +2,23 @@ import customtkinter as ctk
 from typing import Callable, List
 import tkinter as tk
 from tkinter import messagebox
+import threading
 
-from ....theme import SoP
+from ....theme import SoP, get_font, outline_button
+
+# Placeholder entries shown in the dropdown instead of workbook names
+_SENTINEL_NO_WB = "No workbooks open."
+_SENTINEL_ERR = "Error"
+_SENTINEL_HINT = "Click 'Refresh'..."
+_SENTINELS = frozenset((_SENTINEL_NO_WB, _SENTINEL_ERR, _SENTINEL_HINT))
 
 
 class WorkbookExtractor(ctk.CTkFrame):
+    # Minimum gap between two workbook listings (COM round-trips)
+    REFRESH_MIN_INTERVAL_MS = 300
+
     def __init__(self, parent,
-                 # Gets list from manager
+                 # Gets list from manager (called on a worker thread)
                  refresh_list_callback: Callable[[], List[str]],
                  # Takes wb name, runs thread
                  extract_callback: Callable[[str], None],
@@ -19,9 +29,23 @@ class WorkbookExtractor(ctk.CTkFrame):
         self.refresh_list_callback = refresh_list_callback
         self.extract_callback = extract_callback
         self.open_workbook_names: List[str] = []
+        self._menu_loaded = False  # Menu reflects open_workbook_names
+        self._refreshing = False
+        self._refresh_after_id = None
+        self._last_refresh_ms = 0
+        self._busy = False
 
         self._build_widgets()
-        self.refresh_workbook_list()  # Initial population
+        # Initial population waits until the Extract view is first selected
+        # (views are stacked and raised, so all of them map at startup).
+        self._loaded = False
+
+    def ensure_loaded(self):
+        """Runs the first workbook refresh once; later calls are no-ops."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self.refresh_workbook_list()
 
     def _build_widgets(self):
         self.grid_columnconfigure(0, weight=1)
@@ -29,7 +53,7 @@ class WorkbookExtractor(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="Open Workbooks",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=SoP["ACCENT_HOVER"]
         )
         title.grid(row=0, column=0, sticky="ew")
@@ -39,7 +63,7 @@ class WorkbookExtractor(ctk.CTkFrame):
         wb_frame.grid_columnconfigure(0, weight=1)
 
         self.workbook_menu = ctk.CTkOptionMenu(
-            wb_frame, values=["Click 'Refresh'..."],
+            wb_frame, values=[_SENTINEL_HINT],
             fg_color=SoP["EDITOR"], button_color=SoP["ACCENT_DARK"],
             button_hover_color=SoP["ACCENT"], text_color=SoP["TEXT_DIM"],
             height=40
@@ -47,46 +71,89 @@ class WorkbookExtractor(ctk.CTkFrame):
         self.workbook_menu.grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
         self.refresh_wbs_btn = ctk.CTkButton(
-            wb_frame, text="🔄", width=40, height=40, font=ctk.CTkFont(size=20),
+            wb_frame, text="🔄", width=40, height=40, font=get_font(20),
             command=self.refresh_workbook_list,
             fg_color=SoP["TREE_FIELD"], hover_color=SoP["ACCENT_HOVER"]
         )
         self.refresh_wbs_btn.grid(row=0, column=1, padx=5)
 
-        self.extract_btn = ctk.CTkButton(
-            wb_frame, text="📥 Extract from Selected", height=40,
-            command=self._on_extract,
-            fg_color="transparent", border_width=1, border_color=SoP["ACCENT"],
-            hover_color=SoP["TREE_FIELD"], text_color=SoP["ACCENT"], font=ctk.CTkFont(
-                weight="bold")
+        self.extract_btn = outline_button(
+            wb_frame, text="📥 Extract from Selected",
+            command=self._on_extract, font=get_font(weight="bold")
         )
         self.extract_btn.grid(row=1, column=0, columnspan=2,
                               sticky="ew", pady=(10, 0))
 
     def refresh_workbook_list(self):
-        """Gets workbook names via callback and updates the dropdown."""
+        """
+        Lists open workbooks on a worker thread (it goes through COM and
+        can stall), then updates the dropdown back on the UI thread.
+        """
+        if self._refreshing or self._refresh_after_id is not None:
+            return
+        # Clicks right after a refresh are coalesced into one deferred run
+        now = int(self.tk.call("clock", "milliseconds"))
+        wait = self.REFRESH_MIN_INTERVAL_MS - (now - self._last_refresh_ms)
+        if wait > 0:
+            self._refresh_after_id = self.after(wait, self._deferred_refresh)
+            return
+        self._last_refresh_ms = now
+        self._refreshing = True
+        self.refresh_wbs_btn.configure(state="disabled", text="…")
+        threading.Thread(target=self._refresh_worker, daemon=True).start()
+
+    def _deferred_refresh(self):
+        self._refresh_after_id = None
+        self.refresh_workbook_list()
+
+    def _refresh_worker(self):
+        """THREAD TARGET: Runs the list callback; never touches widgets."""
         try:
-            self.open_workbook_names = self.refresh_list_callback()
-            if not self.open_workbook_names:
-                self.workbook_menu.configure(
-                    values=["No workbooks open."], state="disabled")
-                self.workbook_menu.set("No workbooks open.")
-                self.extract_btn.configure(state="disabled")
-            else:
-                self.workbook_menu.configure(
-                    values=self.open_workbook_names, state="normal")
-                self.workbook_menu.set(self.open_workbook_names[0])
-                self.extract_btn.configure(state="normal")
+            result = self.refresh_list_callback()
         except Exception as e:
+            result = e
+        self.after(0, self._apply_refresh, result)
+
+    def _apply_refresh(self, result):
+        """Applies a worker's result (names or the raised exception)."""
+        self._refreshing = False
+        # An extraction may have started meanwhile; set_busy(False) restores
+        ready = "disabled" if self._busy else "normal"
+        self.refresh_wbs_btn.configure(state=ready, text="🔄")
+
+        if isinstance(result, Exception):
             messagebox.showerror(
-                "Error", f"Failed to list open workbooks:\n{e}", parent=self)
-            self.workbook_menu.configure(values=["Error"], state="disabled")
+                "Error", f"Failed to list open workbooks:\n{result}", parent=self)
+            self.open_workbook_names = []
+            self._menu_loaded = False
+            self.workbook_menu.configure(values=[_SENTINEL_ERR], state="disabled")
+            self.extract_btn.configure(state="disabled")
+            return
+        names = result
+
+        # Same workbooks as last time: leave the menu (and selection) alone
+        if self._menu_loaded and names == self.open_workbook_names:
+            return
+        self.open_workbook_names = names
+        self._menu_loaded = True
+
+        if not names:
+            self.workbook_menu.configure(
+                values=[_SENTINEL_NO_WB], state="disabled")
+            self.workbook_menu.set(_SENTINEL_NO_WB)
             self.extract_btn.configure(state="disabled")
+        else:
+            current = self.workbook_menu.get()
+            self.workbook_menu.configure(values=names, state=ready)
+            # Keep the user's pick if that workbook is still open
+            if current not in names:
+                self.workbook_menu.set(names[0])
+            self.extract_btn.configure(state=ready)
 
     def _on_extract(self):
         """Calls the parent's extract thread function."""
         selected_name = self.workbook_menu.get()
-        if not selected_name or selected_name in ["No workbooks open.", "Error", "Click 'Refresh'..."]:
+        if not selected_name or selected_name in _SENTINELS:
             messagebox.showwarning(
                 "No Workbook", "Please select a valid workbook.", parent=self)
             return
@@ -94,8 +161,18 @@ class WorkbookExtractor(ctk.CTkFrame):
 
     def set_busy(self, is_busy: bool):
         """Disables/Enables buttons during operation."""
+        # Repeat calls would only re-send the same (emoji) text and states
+        if is_busy == self._busy:
+            return
+        self._busy = is_busy
         state = "disabled" if is_busy else "normal"
-        text = "Reading..." if is_busy else "📥 Extract from Selected"
-        self.extract_btn.configure(state=state, text=text)
-        self.refresh_wbs_btn.configure(state=state)
-        self.workbook_menu.configure(state=state)
+        # Leaving busy: the menu and extract button only come back if
+        # there are workbooks to pick from (a refresh may be in flight too)
+        has_wbs = bool(self.open_workbook_names)
+        list_state = "normal" if not is_busy and has_wbs else "disabled"
+        self.extract_btn.configure(
+            state=list_state,
+            text="Reading..." if is_busy else "📥 Extract from Selected")
+        self.workbook_menu.configure(state=list_state)
+        if not self._refreshing:
+            self.refresh_wbs_btn.configure(state=state)
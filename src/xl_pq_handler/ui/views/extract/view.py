@@ -4,11 +4,17 @@ from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
 import threading
 import os
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Callable
 
 from ....classes import PQManager, PowerQueryScript, PowerQueryMetadata
+from ....classes.pq_manager.utils import sanitize_name
 from ...theme import SoP
 from ...components.codeview import CTkCodeView
+from ...components.virtual_list import CTkVirtualCheckList
+from ...components.text_runs import insert_runs
 from .components import WorkbookExtractor, FileExtractor, LogViewer
 
 
@@ -23,9 +29,24 @@ class ExtractView(ctk.CTkFrame):
         self.refresh_callback = refresh_callback
 
         self.excel_file_to_extract = ""
-        self.extraction_vars = []  # For the confirmation dialog
+        # For the confirmation dialog: queries and their check state
+        self.extraction_queries: List[Dict[str, Any]] = []
+        self.extraction_checked: List[bool] = []
+        self._selected_count = 0
         self.open_workbook_names = []
 
+        # Reused workers for Excel reads and imports (caps Excel instances)
+        self._extract_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pq-extract")
+        # Parses M-code for the dialog's preview tabs off the UI thread
+        self._preview_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pq-preview")
+        self._preview_req = 0  # Only the newest request may render
+        # body digest -> (params, sources), bounded LRU shared by the workers
+        self._parse_cache: OrderedDict[bytes,
+                                       tuple[list, list]] = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+
         self._build_widgets()
 
     def _build_widgets(self):
@@ -49,8 +70,8 @@ class ExtractView(ctk.CTkFrame):
         # --- Open Workbook Extractor ---
         self.open_wb_extractor = WorkbookExtractor(
             options_panel,
-            # Pass manager method directly
-            refresh_list_callback=self.manager.excel.list_open_workbooks,
+            # Runs on the component's worker thread
+            refresh_list_callback=self._list_open_workbooks,
             extract_callback=self._threaded_get_queries_from_workbook  # Pass thread starter
         )
         self.open_wb_extractor.grid(
@@ -68,17 +89,29 @@ class ExtractView(ctk.CTkFrame):
         self.log_viewer = LogViewer(self)
         self.log_viewer.grid(row=2, column=0, sticky="nsew", pady=(10, 0))
 
+    def on_activate(self):
+        """Called by the app each time this view is selected."""
+        self.open_wb_extractor.ensure_loaded()
+
+    def close(self):
+        """Stops accepting work and drops queued jobs (called on app exit)."""
+        self._extract_pool.shutdown(wait=False, cancel_futures=True)
+        self._preview_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _list_open_workbooks(self) -> List[str]:
+        """THREAD TARGET: Lists open workbooks inside this thread's COM apartment."""
+        with self.manager.excel.com_apartment():
+            return self.manager.excel.list_open_workbooks()
+
     def _threaded_get_queries_from_workbook(self, workbook_name: str):
         self.log_viewer.clear_log()
         self.log_viewer.append_log(
             f"Reading from open workbook: {workbook_name}...\n", "accent")
         self.open_wb_extractor.set_busy(True)  # Tell component it's busy
 
-        threading.Thread(
-            target=self._get_queries_open_wb_target,
-            args=(workbook_name,),
-            daemon=True
-        ).start()
+        self.log_viewer.begin_job()  # Ended in _finalize_extraction
+        self._extract_pool.submit(
+            self._get_queries_open_wb_target, workbook_name)
 
     def _threaded_get_queries_from_file(self, file_path: str):
         self.log_viewer.clear_log()
@@ -87,73 +120,72 @@ class ExtractView(ctk.CTkFrame):
         self.file_extractor.set_busy(True)  # Tell component it's busy
 
         source_name = os.path.basename(file_path)
-        threading.Thread(
-            target=self._get_queries_file_target,
-            args=(file_path, source_name),
-            daemon=True
-        ).start()
+        self.log_viewer.begin_job()  # Ended in _finalize_extraction
+        self._extract_pool.submit(
+            self._get_queries_file_target, file_path, source_name)
 
     def _get_queries_open_wb_target(self, workbook_name: str):
         """
         THREAD TARGET: Gets queries from an open workbook.
         Runs on a worker thread.
         """
-        try:
-            # This acquires AND uses the COM object on the same thread
-            query_list = self.manager.excel.get_queries_from_open_workbook(
-                workbook_name)
-
-            if not query_list:
-                self.log_viewer.append_log(
-                    "No Power Queries found in the workbook.", "error")
-                messagebox.showinfo(
-                    "No Queries Found", f"No Power Queries were found in {workbook_name}.")
-                return
-
-            self.log_viewer.append_log(
-                f"Found {len(query_list)} queries. Opening confirmation dialog...", "accent")
-            self.master.after(0, lambda: self._open_extraction_confirmation_dialog(
-                query_list, workbook_name))
-
-        except Exception as e:
-            self.log_viewer.append_log(f"\n--- ERROR ---\n{e}\n", "error")
-            self.master.after(0, lambda: messagebox.showerror(
-                "Extraction Error", f"An error occurred:\n{e}"))
-        finally:
-            self.master.after(
-                0, lambda: self.open_wb_extractor.set_busy(False))
-            self.master.after(0, lambda: self.file_extractor.set_busy(False))
+        # This acquires AND uses the COM object on the same thread
+        self._run_extraction(
+            lambda: self.manager.excel.get_queries_from_open_workbook(
+                workbook_name),
+            workbook_name)
 
     def _get_queries_file_target(self, file_path: str, source_name: str):
         """
         THREAD TARGET: Gets queries from a closed file.
         Runs on a worker thread.
         """
+        # This creates a new Excel instance on this thread
+        self._run_extraction(
+            lambda: self.manager.excel.get_queries_from_workbook(
+                file_path=file_path),
+            source_name)
+
+    def _run_extraction(self, read_queries: Callable[[], List[Dict[str, str]]],
+                        source_name: str):
+        """
+        WORKER: Reads queries inside this thread's COM apartment, then
+        hands the outcome to the UI thread in a single callback.
+        """
+        query_list, error = [], None
         try:
-            # This creates a new Excel instance on this thread
-            query_list = self.manager.excel.get_queries_from_workbook(
-                file_path=file_path)
+            with self.manager.excel.com_apartment():
+                query_list = read_queries()
 
             if not query_list:
                 self.log_viewer.append_log(
                     "No Power Queries found in the workbook.", "error")
-                messagebox.showinfo(
-                    "No Queries Found", f"No Power Queries were found in {source_name}.")
-                return
-
-            self.log_viewer.append_log(
-                f"Found {len(query_list)} queries. Opening confirmation dialog...", "accent")
-            self.master.after(0, lambda: self._open_extraction_confirmation_dialog(
-                query_list, source_name))
+            else:
+                self.log_viewer.append_log(
+                    f"Found {len(query_list)} queries. Opening confirmation dialog...", "accent")
 
         except Exception as e:
+            error = e
             self.log_viewer.append_log(f"\n--- ERROR ---\n{e}\n", "error")
-            self.master.after(0, lambda: messagebox.showerror(
-                "Extraction Error", f"An error occurred:\n{e}"))
-        finally:
-            self.master.after(
-                0, lambda: self.open_wb_extractor.set_busy(False))
-            self.master.after(0, lambda: self.file_extractor.set_busy(False))
+
+        self.master.after(
+            0, self._finalize_extraction, query_list, source_name, error)
+
+    def _finalize_extraction(self, query_list: List[Dict[str, str]],
+                             source_name: str, error: Exception | None):
+        """UI THREAD: Resets the panels and shows the extraction outcome."""
+        self.log_viewer.end_job()
+        self.open_wb_extractor.set_busy(False)
+        self.file_extractor.set_busy(False)
+
+        if error is not None:
+            messagebox.showerror(
+                "Extraction Error", f"An error occurred:\n{error}")
+        elif not query_list:
+            messagebox.showinfo(
+                "No Queries Found", f"No Power Queries were found in {source_name}.")
+        else:
+            self._open_extraction_confirmation_dialog(query_list, source_name)
 
     # --- Extraction Confirmation Dialog ---
     def _clear_all_tabs(self, tabs: Dict[str, ctk.CTkTextbox]):
@@ -177,13 +209,15 @@ class ExtractView(ctk.CTkFrame):
         Shows a new, ADVANCED dialog to let the user preview
         and select which queries to import.
         """
-        self.extraction_vars = []  # Clear previous vars
+        self.extraction_queries = query_list
+        self.extraction_checked = [True] * len(query_list)
 
         dialog = ctk.CTkToplevel(self)
         dialog.title(f"Extract Queries from {source_name}")
         dialog.geometry("1100x750")  # Make it bigger
         dialog.transient()
-        dialog.grab_set()
+        # Build hidden so the window maps once, fully laid out
+        dialog.withdraw()
         dialog.configure(fg_color=SoP["BG"])
         dialog.grid_columnconfigure(1, weight=3)  # Right panel (preview)
         dialog.grid_columnconfigure(0, weight=1)  # Left panel (list)
@@ -216,12 +250,13 @@ class ExtractView(ctk.CTkFrame):
         dialog_search_entry.grid(
             row=0, column=0, sticky="ew", padx=10, pady=10)
 
-        # Scrollable list for checkboxes
-        scroll_frame = ctk.CTkScrollableFrame(
-            left_panel, fg_color="transparent", corner_radius=8
+        # Scrollable list for checkboxes; only rows in view are materialized
+        query_list_view = CTkVirtualCheckList(
+            left_panel,
+            on_item_click=lambda i: update_preview_panel(query_list[i]),
+            on_item_toggle=lambda i, val: on_toggle(i, val)
         )
-        scroll_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=(0, 10))
-        scroll_frame.grid_columnconfigure(1, weight=1)
+        query_list_view.grid(row=1, column=0, sticky="nsew", padx=5, pady=(0, 10))
 
         # --- Right Panel: TabView for Previews ---
         right_panel = ctk.CTkTabview(
@@ -264,116 +299,126 @@ class ExtractView(ctk.CTkFrame):
                     box.tag_config("type", foreground="#c586c0")
                     box.tag_config("source", foreground="#ce9178")  # Orange
 
-        tab_widgets = {"preview": tab_preview,
-                       "params": tab_params, "sources": tab_sources}
-        for box in tab_widgets.values():
-            box.pack(fill="both", expand=True)
-
-        def clear_tabs():
-            for name, box in tab_widgets.items():
-                box.configure(state="normal")
-                box.delete("1.0", "end")
-                # Insert placeholder text
-                if name == "preview":
-                    box.insert("1.0", "Select query name...", ("dim",))
-                elif name == "params":
-                    box.insert("1.0", "Select query name...", ("dim",))
-                elif name == "sources":
-                    box.insert("1.0", "Select query name...", ("dim",))
-                box.configure(state="disabled")
-
-        clear_tabs()
+        self._clear_all_tabs(tab_widgets)
 
         # --- Helper function to update the preview panel ---
         def update_preview_panel(query_dict: Dict[str, Any]):
             body = query_dict.get("formula", "")
 
-            # 1. Update Preview Tab
+            # 1. Update Preview Tab (tokenizing is cheap enough to do inline)
             tab_preview.set_code(body)
 
-            # 2. Update Parameters Tab
-            params = self.manager.get_parameters_from_code(body)
-            tab_params.configure(state="normal")
-            tab_params.delete("1.0", "end")
+            # 2. Parse parameters/sources on the worker pool
+            self._preview_req += 1
+            req = self._preview_req
+            for box in (tab_params, tab_sources):
+                box.configure(state="normal")
+                box.delete("1.0", "end")
+                box.insert("1.0", "Parsing...", ("dim",))
+                box.configure(state="disabled")
+
+            future = self._preview_pool.submit(self._parse_preview, body)
+            future.add_done_callback(
+                lambda f: self.master.after(0, apply_parsed, req, f))
+
+        def apply_parsed(req: int, future: Future):
+            # A newer click superseded this one, or the dialog is gone
+            if req != self._preview_req or not dialog.winfo_exists():
+                return
+            try:
+                params, sources = future.result()
+            except Exception as e:
+                params, sources = [], []
+                self.log_viewer.append_log(f"Parse error: {e}\n", "error")
+
+            # 3. Update Parameters Tab
             if not params:
-                tab_params.insert(
-                    "1.0", "This query is not a function.", ("dim",))
+                param_runs = [("This query is not a function.", ("dim",))]
             else:
+                param_runs = []
                 for p in params:
-                    tab_params.insert("end", f"Name:     ", ("dim",))
-                    tab_params.insert("end", f"{p['name']}\n", ("name",))
-                    tab_params.insert("end", f"Type:     ", ("dim",))
-                    tab_params.insert("end", f"{p['type']}\n", ("type",))
-                    tab_params.insert("end", f"Optional: ", ("dim",))
-                    tab_params.insert(
-                        "end", f"{'Yes' if p['optional'] else 'No'}\n\n", ("name",))
-            tab_params.configure(state="disabled")
-
-            # 3. Update Data Sources Tab
-            sources = self.manager.get_datasources_from_code(body)
-            tab_sources.configure(state="normal")
-            tab_sources.delete("1.0", "end")
+                    param_runs += (
+                        ("Name:     ", ("dim",)),
+                        (f"{p['name']}\n", ("name",)),
+                        ("Type:     ", ("dim",)),
+                        (f"{p['type']}\n", ("type",)),
+                        ("Optional: ", ("dim",)),
+                        (f"{'Yes' if p['optional'] else 'No'}\n\n", ("name",)),
+                    )
+
+            # 4. Update Data Sources Tab
             if not sources:
-                tab_sources.insert(
-                    "1.0", "No external data sources found.", ("dim",))
+                source_runs = [("No external data sources found.", ("dim",))]
             else:
+                source_runs = []
                 for src in sources:
-                    tab_sources.insert("end", f"Type:   ", ("dim",))
-                    tab_sources.insert("end", f"{src['type']}\n", ("type",))
-                    tab_sources.insert("end", f"Source: ", ("dim",))
-                    tab_sources.insert(
-                        "end", f"{src['full_argument']}", ("source",))
-                    tab_sources.insert(
-                        "end", f" (Input Parameter)\n\n" if src["source_type"] == "Variable" else "\n\n")
-            tab_sources.configure(state="disabled")
+                    source_runs += (
+                        ("Type:   ", ("dim",)),
+                        (f"{src['type']}\n", ("type",)),
+                        ("Source: ", ("dim",)),
+                        (f"{src['full_argument']}", ("source",)),
+                        (" (Input Parameter)\n\n" if src["source_type"] == "Variable" else "\n\n", ()),
+                    )
+
+            for box, runs in ((tab_params, param_runs), (tab_sources, source_runs)):
+                box.configure(state="normal")
+                box.delete("1.0", "end")
+                insert_runs(box, runs)
+                box.configure(state="disabled")
 
         # --- Populate the Checkbox List ---
 
-        # This will hold (checkbox, button, query_dict)
-        query_widgets = []
-
-        for i, query in enumerate(query_list):
-            var = tk.BooleanVar(value=True)
-            name = str(query.get("name"))
-
-            # Create a frame for each row
-            row_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
-            row_frame.grid(row=i, column=0, sticky="ew")
-            row_frame.grid_columnconfigure(1, weight=1)
-
-            cb = ctk.CTkCheckBox(
-                row_frame, text="", variable=var,
-                fg_color=SoP["ACCENT"], hover_color=SoP["ACCENT_HOVER"],
-                width=30
-            )
-            cb.grid(row=0, column=0, padx=5, pady=(5, 0))
-
-            # THIS BUTTON is for PREVIEW
-            name_btn = ctk.CTkButton(
-                row_frame,
-                text=name,
-                fg_color="transparent",
-                text_color=SoP["TEXT"],
-                hover_color=SoP["EDITOR"],
-                anchor="w",
-                command=lambda q=query: update_preview_panel(q)
-            )
-            name_btn.grid(row=0, column=1, sticky="ew", pady=(5, 0))
-
-            # Store everything for filtering and importing
-            self.extraction_vars.append((var, query))
-            query_widgets.append((row_frame, name.lower(), query))
+        # Every row starts checked; rows read and write this list directly
+        checked = self.extraction_checked
+        self._selected_count = len(query_list)
+
+        names = [str(query.get("name")) for query in query_list]
+        names_lower = [name.lower() for name in names]
+        query_list_view.set_items(names, checked)
 
         # --- Search/Filter Function ---
-        def filter_queries(*args):
+        last_filter = [""]
+        # trigram -> indices of names containing it; built on first use
+        trigrams: Dict[str, set] = {}
+
+        def trigram_candidates(query: str):
+            """Indices whose names contain every trigram of the query."""
+            if not trigrams:
+                for i, name in enumerate(names_lower):
+                    for j in range(len(name) - 2):
+                        trigrams.setdefault(name[j:j + 3], set()).add(i)
+            postings = sorted(
+                (trigrams.get(query[j:j + 3], set())
+                 for j in range(len(query) - 2)), key=len)
+            return sorted(postings[0].intersection(*postings[1:]))
+
+        def filter_queries():
+            self._filter_after_id = None
+            if not dialog.winfo_exists():
+                return  # Closed within the debounce window
             query = dialog_search_var.get().lower()
-            for row_frame, name, query_dict in query_widgets:
-                if query in name:
-                    row_frame.grid()
-                else:
-                    row_frame.grid_remove()
+            prev = last_filter[0]
+            if query == prev:
+                return
+            last_filter[0] = query
+            if query.startswith(prev):
+                # Narrowing can only drop rows, so rescan just the shown ones
+                candidates = query_list_view.visible_indices
+            elif len(query) >= 3:
+                # Trigram hits are a superset; the substring check confirms
+                candidates = trigram_candidates(query)
+            else:
+                candidates = range(len(names_lower))
+            query_list_view.set_order(
+                [i for i in candidates if query in names_lower[i]])
 
-        dialog_search_var.trace_add("write", filter_queries)
+        def schedule_filter(*args):
+            if self._filter_after_id is not None:
+                dialog.after_cancel(self._filter_after_id)
+            self._filter_after_id = dialog.after(120, filter_queries)
+
+        self._filter_after_id = None
+        dialog_search_var.trace_add("write", schedule_filter)
 
         # --- Action Buttons (Bottom) ---
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -382,13 +427,15 @@ class ExtractView(ctk.CTkFrame):
         btn_frame.grid_columnconfigure(3, weight=1)
 
         def select_all(val):
-            for row_frame, name, query in query_widgets:
-                if row_frame.winfo_viewable():  # Only affect visible items
-                    # Find the var for this query
-                    for var, q in self.extraction_vars:
-                        if q['name'] == query['name']:
-                            var.set(val)
-                            break
+            delta = 0
+            for i in query_list_view.visible_indices:
+                # Only affect visible items that actually change
+                if checked[i] != val:
+                    checked[i] = val
+                    delta += 1
+            self._selected_count += delta if val else -delta
+            query_list_view.sync_checks()  # Only the rows in view
+            update_btn_text()
 
         ctk.CTkButton(
             btn_frame, text="Select All Visible", fg_color=SoP["FRAME"], text_color=SoP["TEXT_DIM"],
@@ -409,19 +456,48 @@ class ExtractView(ctk.CTkFrame):
         import_btn.grid(row=0, column=3, sticky="e")
 
         # Update button text on selection change
-        def update_btn_text(*args):
-            count = sum(1 for var, q in self.extraction_vars if var.get())
-            import_btn.configure(text=f"Import {count} Queries")
+        def update_btn_text():
+            import_btn.configure(text=f"Import {self._selected_count} Queries")
 
-        for var, q in self.extraction_vars:
-            var.trace_add("write", update_btn_text)
+        # Live count: a click flips one row (the list already stored it)
+        def on_toggle(i: int, val: bool):
+            self._selected_count += 1 if val else -1
+            update_btn_text()
+
+        # One layout pass, then show; grab needs a viewable window
+        dialog.update_idletasks()
+        dialog.deiconify()
+        dialog.grab_set()
+
+    PARSE_CACHE_SIZE = 256
+
+    def _parse_preview(self, body: str):
+        """
+        WORKER: Parses a query body for the preview tabs.
+        Returns (parameters, data sources), memoized by body digest.
+        """
+        key = hashlib.blake2b(body.encode("utf-8"), digest_size=8).digest()
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+                return cached
+
+        result = (self.manager.get_parameters_from_code(body),
+                  self.manager.get_datasources_from_code(body))
+
+        with self._parse_cache_lock:
+            self._parse_cache[key] = result
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return result
 
     def _threaded_confirm_extraction(self, dialog: ctk.CTkToplevel):
         """Step 2: Gathers selected queries and passes them to the writer thread."""
 
         # This logic is now cleaner, just reads the list
-        selected_queries = [query for var,
-                            query in self.extraction_vars if var.get()]
+        selected_queries = [query for is_checked, query in zip(
+            self.extraction_checked, self.extraction_queries) if is_checked]
 
         if not selected_queries:
             messagebox.showwarning(
@@ -434,50 +510,61 @@ class ExtractView(ctk.CTkFrame):
         self.log_viewer.append_log(
             f"Importing {len(selected_queries)} selected queries...\n\n", "accent")
 
-        threading.Thread(
-            target=self._confirm_extraction,
-            args=(selected_queries,),
-            daemon=True
-        ).start()
+        self.log_viewer.begin_job()  # Ended when _confirm_extraction finishes
+        self._extract_pool.submit(self._confirm_extraction, selected_queries)
+
+    def _save_one_query(self, q: Dict[str, Any], target_dir: str) -> str:
+        """WORKER: Builds the script for one extracted query and saves it."""
+        name = q["name"]
+
+        # 1. Determine safe path
+        safe_name = sanitize_name(name)
+        out_path = f"{target_dir}{os.sep}{safe_name}.pq"
+
+        # 2. Create Pydantic Models. The payload comes straight from Excel
+        # with known types, so skip validation; only the description
+        # needs the validator's newline cleanup.
+        description = str(q["description"] or "").replace(
+            "\r", " ").replace("\n", " ").strip()
+        meta = PowerQueryMetadata.model_construct(
+            name=name,
+            category="Extracted",
+            description=description,
+            tags=["extracted"],
+            dependencies=[],  # We don't know deps on extraction
+            version="1.0",
+            path=out_path
+        )
+        script = PowerQueryScript.model_construct(meta=meta, body=q["formula"])
+
+        # 3. Save using the store
+        self.manager.store.save_script(script, overwrite=True)
+        return out_path
 
     def _confirm_extraction(self, selected_queries: List[Dict[str, Any]]):
         """Step 3: (Thread Target) Creates the files and refreshes the UI."""
         created_files = []
         try:
-            # NEW API LOGIC: Loop, create script objects, and save.
-            for q in selected_queries:
-                try:
-                    name = q["name"]
-                    category = "Extracted"
-
-                    # 1. Determine safe path
-                    safe_name = "".join(c for c in name if c.isalnum()
-                                        or c in (' ', '_', '-')).rstrip()
-                    safe_category = "Extracted"
-
-                    target_dir = os.path.join(
-                        self.manager.store.root, "functions", safe_category)
-                    out_path = os.path.join(target_dir, f"{safe_name}.pq")
-
-                    # 2. Create Pydantic Models
-                    meta = PowerQueryMetadata(
-                        name=name,
-                        category=category,
-                        description=q["description"],
-                        tags=["extracted"],
-                        dependencies=[],  # We don't know deps on extraction
-                        version="1.0",
-                        path=out_path
-                    )
-                    script = PowerQueryScript(meta=meta, body=q["formula"])
-
-                    # 3. Save using the store
-                    self.manager.store.save_script(script, overwrite=True)
-                    created_files.append(out_path)
-
-                except Exception as e:
-                    self.log_viewer.append_log(
-                        f"Failed to save query {q['name']}: {e}\n", "error")
+            target_dir = os.path.join(
+                self.manager.store.root, "functions", "Extracted")
+            # Create the folder once instead of racing makedirs per save
+            os.makedirs(target_dir, exist_ok=True)
+
+            # NEW API LOGIC: build + save each query on a small pool;
+            # every query writes its own file, so they don't contend
+            workers = min(8, (os.cpu_count() or 1) * 2, len(selected_queries))
+            with ThreadPoolExecutor(max_workers=max(1, workers),
+                                    thread_name_prefix="pq-save") as pool:
+                futures = {
+                    pool.submit(self._save_one_query, q, target_dir): q
+                    for q in selected_queries
+                }
+                for future in as_completed(futures):
+                    try:
+                        created_files.append(future.result())
+                    except Exception as e:
+                        self.log_viewer.append_log(
+                            f"Failed to save query {futures[future]['name']}: {e}\n", "error")
 
             # 4. Rebuild the index *once* after all files are saved
             if created_files:
@@ -489,10 +576,14 @@ class ExtractView(ctk.CTkFrame):
                 f"\nImport complete.\nCreated {len(created_files)} files.\n", "accent_bold")
 
             # 5. Use callback to refresh the main UI
-            self.master.after(0, self.refresh_callback)
+            # The index was just rebuilt above; only refresh the views
+            self.master.after(
+                0, lambda: self.refresh_callback(rebuild_index=False))
 
         except Exception as e:
             self.log_viewer.append_log(
                 f"\n--- FATAL ERROR ---\n{e}\n", "error")
             self.master.after(0, lambda: messagebox.showerror(
                 "Import Error", f"An error occurred:\n{e}"))
+        finally:
+            self.master.after(0, self.log_viewer.end_job)
@@ -1,18 +1,48 @@
 import tkinter as tk
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Executor, Future
+from itertools import islice
 import customtkinter as ctk
 from typing import Callable, Dict, List, Tuple
 
-from ....theme import SoP
-from ....components import CTkCodeView
+from ....theme import SoP, get_font
+from ....components import CTkCodeView, insert_runs
 from .....classes import PQManager, PowerQueryScript
 
 
+@contextmanager
+def _editable(widget):
+    """Makes a read-only tab widget writable for the duration of the block."""
+    widget.configure(state="normal")
+    try:
+        yield widget
+    finally:
+        widget.configure(state="disabled")
+
+
 class BottomPanel(ctk.CTkFrame):
     """
     Component for the bottom panel in the Library view,
     containing the TabView and Action buttons/controls.
     """
 
+    # Tab title -> widget key for tabs that need a single selection
+    SINGLE_SELECTION_TABS = {
+        "Parameters": "params", "Dependencies": "deps", "Graph": "graph",
+        "Data Sources": "sources", "Preview": "preview"}
+    SINGLE_SELECTION_PLACEHOLDERS = {
+        "params": "parameters", "deps": "dependencies",
+        "graph": "dependency graph", "sources": "data sources",
+        "preview": "M-code"}
+    # Extra text tags (name, foreground) per textbox tab
+    _TAB_TAGS = {
+        "params": (("name", SoP["ACCENT_HOVER"]), ("type", "#ce9178")),
+        "sources": (("type", "#c586c0"), ("source", "#ce9178"))}
+    DESCRIPTION_MAX_ITEMS = 10  # Selected rows described in full
+    PARSE_CACHE_SIZE = 256  # Parsed bodies kept per tab kind (LRU)
+
     def __init__(self,
                  parent,
                  manager: PQManager,
@@ -20,6 +50,8 @@ class BottomPanel(ctk.CTkFrame):
                  clear_selection_callback: Callable,
                  refresh_wb_list_callback: Callable,
                  format_tree_string_callback: Callable,  # Pass tree formatter
+                 dependency_tree_callback: Callable,  # name -> tree dict
+                 parse_executor: Executor,  # Runs M-code parses off the UI thread
                  **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         self.manager = manager
@@ -27,12 +59,25 @@ class BottomPanel(ctk.CTkFrame):
         self.clear_selection_callback = clear_selection_callback
         self.refresh_wb_list_callback = refresh_wb_list_callback
         self.format_tree_string_callback = format_tree_string_callback
+        self.dependency_tree_callback = dependency_tree_callback
+        self.parse_executor = parse_executor
 
         self.grid_columnconfigure(0, weight=1)  # TabView area
         self.grid_columnconfigure(1, weight=0)  # Action Panel area
         self.grid_rowconfigure(0, weight=1)
 
         self.tab_widgets: Dict[str, ctk.CTkTextbox | CTkCodeView] = {}
+        self._tab_script: PowerQueryScript | None = None
+        self._tab_key = None  # (name, body) the single-selection tabs show
+        self._dirty_tabs: set[str] = set()  # Tabs awaiting a lazy render
+        self._desc_key = None  # What the Description tab currently shows
+        self._preview_body: str | None = None  # Code in the Preview tab
+        self._workbook_names: List[str] | None = None  # Listed in the menu
+        # Rendered output caches, cleared by invalidate_caches()
+        self._graph_cache: Dict[str, str] = {}  # name -> tree string
+        # (kind, body digest) -> result list or error message, bounded LRU
+        self._parse_cache: OrderedDict[tuple, list | str] = OrderedDict()
+        self._parse_pending: set[tuple] = set()  # Keys queued on the executor
 
         self._build_widgets()
 
@@ -50,7 +95,8 @@ class BottomPanel(ctk.CTkFrame):
             segmented_button_unselected_hover_color=SoP["TREE_FIELD"],
             text_color=SoP["TEXT_DIM"],
             border_width=1,
-            border_color=SoP["FRAME"]
+            border_color=SoP["FRAME"],
+            command=self._on_tab_change
         )
         self.tabview.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
         self._create_tab_widgets(self.tabview)
@@ -75,7 +121,7 @@ class BottomPanel(ctk.CTkFrame):
 
         self.refresh_insert_wbs_btn = ctk.CTkButton(
             wb_select_frame, text="🔄", width=35, height=35,
-            font=ctk.CTkFont(size=20),
+            font=get_font(20),
             command=self.refresh_wb_list_callback,  # Call parent's method
             fg_color=SoP["TREE_FIELD"], hover_color=SoP["ACCENT_HOVER"]
         )
@@ -86,7 +132,7 @@ class BottomPanel(ctk.CTkFrame):
             action_panel, text="➕ Insert Selected", height=40,
             command=self.insert_callback,  # Call parent's insert method
             fg_color=SoP["ACCENT"], hover_color=SoP["ACCENT_HOVER"],
-            text_color="#000000", font=ctk.CTkFont(weight="bold")
+            text_color="#000000", font=get_font(weight="bold")
         )
         self.insert_btn.grid(row=1, column=0, sticky="ew", pady=(5, 10))
 
@@ -104,59 +150,59 @@ class BottomPanel(ctk.CTkFrame):
         self.selection_count_lbl.grid(row=3, column=0, sticky="ew", pady=10)
 
     def _create_tab_widgets(self, tabview):
-        """Creates the text widgets inside the TabView."""
-        self.tab_widgets["desc"] = ctk.CTkTextbox(
-            tabview.add("Description"), fg_color="transparent", font=("Consolas", 12))
-        self.tab_widgets["params"] = ctk.CTkTextbox(
-            tabview.add("Parameters"), fg_color="transparent", font=("Consolas", 12))
-        self.tab_widgets["deps"] = ctk.CTkTextbox(
-            tabview.add("Dependencies"), fg_color="transparent", font=("Consolas", 12))
-        self.tab_widgets["graph"] = ctk.CTkTextbox(
-            tabview.add("Graph"), fg_color="transparent", font=("Consolas", 12))
-        self.tab_widgets["sources"] = ctk.CTkTextbox(
-            tabview.add("Data Sources"), fg_color="transparent", font=("Consolas", 12))
-        self.tab_widgets["preview"] = CTkCodeView(
-            tabview.add("Preview"), manager=self.manager)
-
-        for name, widget in self.tab_widgets.items():
-            widget.pack(fill="both", expand=True, padx=(
-                0 if name == "preview" else 5), pady=(0 if name == "preview" else 5))
-            widget.configure(state="disabled")
+        """
+        Adds the tabs. Only the Description widget is built now; the
+        others are built the first time their tab is shown.
+        """
+        self._tab_frames = {"desc": tabview.add("Description")}
+        for title, name in self.SINGLE_SELECTION_TABS.items():
+            self._tab_frames[name] = tabview.add(title)
+        self._build_tab_widget("desc")
+
+    def _build_tab_widget(self, name: str):
+        """Creates, packs and fills in the placeholder for one tab."""
+        frame = self._tab_frames[name]
+        if name == "preview":
+            # CodeView configures its own tags, 'dim' included
+            widget = CTkCodeView(frame, manager=self.manager)
+            widget.pack(fill="both", expand=True)
+            placeholder = "Select a query to preview M-code."
+        else:
+            widget = ctk.CTkTextbox(
+                frame, fg_color="transparent", font=("Consolas", 12))
+            widget.pack(fill="both", expand=True, padx=5, pady=5)
             self._configure_tab_tags(widget, name)
-            # Add initial placeholder text
-            placeholder = f"Select a query to view {name}."
-            if name == "desc":
-                placeholder = "Select query(s) to view description."
-            elif name == "preview":
-                placeholder = "Select a query to preview M-code."
-            widget.insert("1.0", placeholder, ("dim",))
-            widget.configure(state="disabled")  # Re-disable after insert
+            placeholder = ("Select query(s) to view description." if name == "desc"
+                           else "Select a single query to view {}.".format(
+                               self.SINGLE_SELECTION_PLACEHOLDERS[name]))
+        self.tab_widgets[name] = widget
+        # New textboxes start editable: insert, then lock once
+        widget.insert("1.0", placeholder, ("dim",))
+        widget.configure(state="disabled")
 
     def _configure_tab_tags(self, widget, tab_name):
-        """Configures tags for a specific tab widget."""
-        # Ensure dim tag exists for all
+        """Configures tags for a specific textbox tab."""
         widget.tag_config("dim", foreground=SoP["TEXT_DIM"])
-
-        if isinstance(widget, CTkCodeView):
-            # CodeView handles its own code tags, just ensure 'dim' is available
-            pass
-        else:
-            # Configure tags for standard textboxes
-            if tab_name == "params":
-                widget.tag_config("name", foreground=SoP["ACCENT_HOVER"])
-                widget.tag_config("type", foreground="#ce9178")
-            elif tab_name == "sources":
-                widget.tag_config("type", foreground="#c586c0")
-                widget.tag_config("source", foreground="#ce9178")
+        for tag, color in self._TAB_TAGS.get(tab_name, ()):
+            widget.tag_config(tag, foreground=color)
 
     # --- Public Update Methods (Called by Parent View) ---
 
+    def invalidate_caches(self):
+        """Drops cached graphs/parses (call after the library reloads)."""
+        self._graph_cache.clear()
+        self._parse_cache.clear()
+        self._tab_key = None  # Graphs may differ even for the same body
+
     def update_selection_count(self, count: int):
         """Updates the 'Selected: X' label."""
         self.selection_count_lbl.configure(text=f"Selected: {count}")
 
     def update_workbook_list(self, workbook_names: List[str]):
         """Updates the workbook dropdown for insertion."""
+        if workbook_names == self._workbook_names:
+            return  # Same workbooks: keep the menu and the chosen target
+        self._workbook_names = list(workbook_names)
         menu_values = ["Default (Active)"] + workbook_names
         self.insert_wb_menu.configure(values=menu_values)
         self.insert_wb_menu.set("Default (Active)")
@@ -165,138 +211,198 @@ class BottomPanel(ctk.CTkFrame):
 
     def update_description(self, item_values_list: List[Tuple[str, ...]]):
         """Updates the Description tab based on selected items."""
-        widget = self.tab_widgets["desc"]
-        widget.configure(state="normal")
-        widget.delete("1.0", "end")
-        if not item_values_list:
-            widget.insert(
-                "1.0", "Select row(s) to view description.", ("dim",))
-        else:
-            descs = []
-            for i, vals in enumerate(item_values_list):
-                if i >= 10:
-                    descs.append(
-                        f"\n... and {len(item_values_list) - 10} more ...")
-                    break
-                name, _, descr, _ = vals
-                descs.append(f"--- {name} ---\n{descr or 'No description.'}")
-            widget.insert("1.0", "\n\n".join(descs))
-        widget.configure(state="disabled")
+        shown = list(islice(item_values_list, self.DESCRIPTION_MAX_ITEMS))
+        remaining = len(item_values_list) - len(shown)
+        desc_key = (tuple(shown), remaining)
+        if desc_key == self._desc_key:
+            return  # Same rows, same text
+        self._desc_key = desc_key
+
+        with _editable(self.tab_widgets["desc"]) as widget:
+            widget.delete("1.0", "end")
+            if not shown:
+                widget.insert(
+                    "1.0", "Select row(s) to view description.", ("dim",))
+            else:
+                descs = [f"--- {name} ---\n{descr or 'No description.'}"
+                         for name, _, descr, _ in shown]
+                if remaining:
+                    descs.append(f"\n... and {remaining} more ...")
+                widget.insert("1.0", "\n\n".join(descs))
 
     def update_single_selection_tabs(self, script: PowerQueryScript | None):
-        """Updates tabs that only show info for a single selected query."""
-        # Clear all single-selection tabs first
-        tabs_to_update = ["params", "deps", "graph", "sources", "preview"]
-        for name in tabs_to_update:
-            widget = self.tab_widgets[name]
-            widget.configure(state="normal")
+        """
+        Updates tabs that only show info for a single selected query.
+        Only the visible tab is rendered now; the others are marked
+        dirty and rendered when the user switches to them.
+        """
+        tab_key = (script.meta.name, script.body) if script else None
+        if tab_key == self._tab_key:
+            return  # Same query, same code: the tabs are already current
+        self._tab_key = tab_key
+        self._tab_script = script
+        self._dirty_tabs = set(self.SINGLE_SELECTION_TABS)
+        self._on_tab_change()
+
+    def _on_tab_change(self):
+        """Renders the newly visible tab if its content is stale."""
+        key = self.SINGLE_SELECTION_TABS.get(self.tabview.get())
+        if key is not None and key not in self.tab_widgets:
+            self._build_tab_widget(key)
+        if key in self._dirty_tabs:
+            self._dirty_tabs.discard(key)
+            self._render_tab(key, self._tab_script)
+
+    def _render_tab(self, name: str, script: PowerQueryScript | None):
+        if name == "preview" and script and script.body == self._preview_body:
+            return  # The CodeView already shows exactly this code
+        if name == "preview":
+            self._preview_body = None  # Set again once set_code succeeds
+        with _editable(self.tab_widgets[name]) as widget:
             widget.delete("1.0", "end")
-        if not script:
-            # Insert placeholder text if no script or multiple selected
-            placeholder = "Select a single query to view {}."
-            self.tab_widgets["params"].insert(
-                "1.0", placeholder.format("parameters"), ("dim",))
-            self.tab_widgets["deps"].insert(
-                "1.0", placeholder.format("dependencies"), ("dim",))
-            self.tab_widgets["graph"].insert(
-                "1.0", placeholder.format("dependency graph"), ("dim",))
-            self.tab_widgets["sources"].insert(
-                "1.0", placeholder.format("data sources"), ("dim",))
-            self.tab_widgets["preview"].insert(
-                "1.0", placeholder.format("M-code"), ("dim",))
-            # Re-disable after insert
-            for name in tabs_to_update:
-                self.tab_widgets[name].configure(state="disabled")
-            return
-        else:
-
-            # --- Update Parameters ---
-            try:
-                widget = self.tab_widgets["params"]
-                widget.configure(state="normal")
-                params = self.manager.get_parameters_from_code(script.body)
-                if not params:
-                    widget.insert("1.0", "Not a function.", ("dim",))
-                else:
-                    for p in params:
-                        widget.insert("end", f"Name:     ", ("dim",))
-                        widget.insert("end", f"{p['name']}\n", ("name",))
-                        widget.insert("end", f"Type:     ", ("dim",))
-                        widget.insert("end", f"{p['type']}\n", ("type",))
-                        widget.insert("end", f"Optional: ", ("dim",))
-                        widget.insert(
-                            "end", f"{'Yes' if p['optional'] else 'No'}\n\n", ("name",))
-            except Exception as e:
-                self._show_tab_error("params", f"Parse error: {e}")
-
-            # --- Update Dependencies (List) ---
-            try:
-                widget = self.tab_widgets["deps"]
-                widget.configure(state="normal")
-                deps_list = script.meta.dependencies
-                if deps_list:
-                    widget.insert(
-                        "1.0", f"Dependencies for {script.meta.name}:\n")
-                    for d in deps_list:
-                        widget.insert("end", f"\n • {d}")
-                else:
-                    widget.insert("1.0", "No dependencies.", ("dim",))
-            except Exception as e:
-                self._show_tab_error("deps", f"Error: {e}")
-
-            # --- Update Dependency Graph ---
-            try:
-                widget = self.tab_widgets["graph"]
-                widget.configure(state="normal")
-                tree_data = self.manager.resolver.get_dependency_tree(
-                    script.meta.name)
+            if not script:
+                # Insert placeholder text if no script or multiple selected
+                widget.insert("1.0", "Select a single query to view {}.".format(
+                    self.SINGLE_SELECTION_PLACEHOLDERS[name]), ("dim",))
+            elif name == "params":
+                self._render_params(widget, script)
+            elif name == "deps":
+                self._render_deps(widget, script)
+            elif name == "graph":
+                self._render_graph(widget, script)
+            elif name == "sources":
+                self._render_sources(widget, script)
+            elif name == "preview":
+                self._render_preview(widget, script)
+
+    def _parsed(self, kind: str, body: str, parse: Callable):
+        """
+        Returns the cached parse of `body` (a list, or the error message
+        string if parsing failed). On a miss the parse is queued on the
+        executor and None is returned; the `kind` tab re-renders when the
+        result lands.
+        """
+        key = (kind, hashlib.blake2b(
+            body.encode("utf-8"), digest_size=8).digest())
+        result = self._parse_cache.get(key)
+        if result is not None:
+            self._parse_cache.move_to_end(key)
+            return result
+        if key not in self._parse_pending:
+            self._parse_pending.add(key)
+            self.parse_executor.submit(parse, body).add_done_callback(
+                lambda f: self.after(0, self._apply_parse, key, body, f))
+        return None
+
+    def _apply_parse(self, key: tuple, body: str, future: Future):
+        """Caches a finished parse and re-renders its tab if still shown."""
+        self._parse_pending.discard(key)
+        try:
+            self._parse_cache[key] = future.result()
+        except Exception as e:
+            self._parse_cache[key] = str(e)  # Shown by the tab's renderer
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        kind = key[0]
+        if self._tab_script is not None and self._tab_script.body == body:
+            self._dirty_tabs.add(kind)
+            self._on_tab_change()
+
+    def _render_params(self, widget, script: PowerQueryScript):
+        try:
+            params = self._parsed(
+                "params", script.body, self.manager.get_parameters_from_code)
+            if params is None:
+                widget.insert("1.0", "Parsing parameters...", ("dim",))
+            elif isinstance(params, str):
+                self._show_tab_error("params", f"Parse error: {params}")
+            elif not params:
+                widget.insert("1.0", "Not a function.", ("dim",))
+            else:
+                runs = []
+                for p in params:
+                    runs += (
+                        ("Name:     ", ("dim",)),
+                        (f"{p['name']}\n", ("name",)),
+                        ("Type:     ", ("dim",)),
+                        (f"{p['type']}\n", ("type",)),
+                        ("Optional: ", ("dim",)),
+                        (f"{'Yes' if p['optional'] else 'No'}\n\n", ("name",)),
+                    )
+                insert_runs(widget, runs)
+        except Exception as e:
+            self._show_tab_error("params", f"Parse error: {e}")
+
+    def _render_deps(self, widget, script: PowerQueryScript):
+        try:
+            deps_list = script.meta.dependencies
+            if deps_list:
+                widget.insert("1.0", f"Dependencies for {script.meta.name}:\n"
+                              + "".join(f"\n • {d}" for d in deps_list))
+            else:
+                widget.insert("1.0", "No dependencies.", ("dim",))
+        except Exception as e:
+            self._show_tab_error("deps", f"Error: {e}")
+
+    def _render_graph(self, widget, script: PowerQueryScript):
+        try:
+            name = script.meta.name
+            tree_string = self._graph_cache.get(name)
+            if tree_string is None:
+                tree_data = self.dependency_tree_callback(name)
                 tree_string = self.format_tree_string_callback(tree_data)
-                widget.insert("1.0", tree_string)
-            except Exception as e:
-                self._show_tab_error("graph", f"Could not build graph: {e}")
-
-            # --- Update Data Sources ---
-            try:
-                widget = self.tab_widgets["sources"]
-                widget.configure(state="normal")
-                sources = self.manager.get_datasources_from_code(script.body)
-                if not sources:
-                    widget.insert("1.0", "No external data sources.", ("dim",))
-                else:
-                    for src in sources:
-                        widget.insert("end", f"Type:   ", ("dim",))
-                        widget.insert("end", f"{src['type']}\n", ("type",))
-                        widget.insert("end", f"Source: ", ("dim",))
-                        widget.insert(
-                            "end", f"{src['full_argument']}", ("source",))
-                        suffix = ""
-                        if src["source_type"] == "Variable":
-                            suffix = " (Input Parameter)"
-                        elif src["source_type"] == "Literal":
-                            suffix = " (Literal)"
-                        widget.insert("end", f"{suffix}\n\n", ("dim",))
-            except Exception as e:
+                self._graph_cache[name] = tree_string
+            widget.insert("1.0", tree_string)
+        except Exception as e:
+            self._show_tab_error("graph", f"Could not build graph: {e}")
+
+    def _render_sources(self, widget, script: PowerQueryScript):
+        try:
+            sources = self._parsed(
+                "sources", script.body, self.manager.get_datasources_from_code)
+            if sources is None:
+                widget.insert("1.0", "Parsing data sources...", ("dim",))
+            elif isinstance(sources, str):
                 self._show_tab_error(
-                    "sources", f"Could not parse sources: {e}")
-
-            # --- Update Preview ---
-            try:
-                code_widget = self.tab_widgets["preview"]
-                if isinstance(code_widget, CTkCodeView):
-                    code_widget.set_code(script.body)
-            except Exception as e:
-                self._show_tab_error("preview", f"Could not render code: {e}")
-
-        for name in tabs_to_update:
-            self.tab_widgets[name].configure(state="disabled")
+                    "sources", f"Could not parse sources: {sources}")
+            elif not sources:
+                widget.insert("1.0", "No external data sources.", ("dim",))
+            else:
+                runs = []
+                for src in sources:
+                    suffix = ""
+                    if src["source_type"] == "Variable":
+                        suffix = " (Input Parameter)"
+                    elif src["source_type"] == "Literal":
+                        suffix = " (Literal)"
+                    runs += (
+                        ("Type:   ", ("dim",)),
+                        (f"{src['type']}\n", ("type",)),
+                        ("Source: ", ("dim",)),
+                        (f"{src['full_argument']}", ("source",)),
+                        (f"{suffix}\n\n", ("dim",)),
+                    )
+                insert_runs(widget, runs)
+        except Exception as e:
+            self._show_tab_error(
+                "sources", f"Could not parse sources: {e}")
+
+    def _render_preview(self, widget, script: PowerQueryScript):
+        try:
+            if isinstance(widget, CTkCodeView):
+                widget.set_code(script.body)
+                self._preview_body = script.body
+        except Exception as e:
+            self._show_tab_error("preview", f"Could not render code: {e}")
 
     def _show_tab_error(self, tab_name: str, message: str):
-        """Helper to display an error message in a tab."""
+        """
+        Helper to display an error message in a tab. Only called from
+        the _render_* methods, while _render_tab holds the tab editable.
+        """
         widget = self.tab_widgets[tab_name]
-        widget.configure(state="normal")
         widget.delete("1.0", "end")
         widget.insert("1.0", message, ("dim",))
-        widget.configure(state="disabled")
 
     # --- Public method for parent to get selected workbook ---
     def get_selected_workbook_target(self) -> str | None:
@@ -2,33 +2,55 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 import os
+import re
 from typing import Callable
 
 from .....classes import PQManager, PowerQueryMetadata, PowerQueryScript
-from ....theme import SoP
+from .....classes.pq_manager.utils import sanitize_name
+from ....theme import SoP, get_font
 from ....components import CTkCodeView
 
+# One comma-separated item, without surrounding whitespace (empty items skipped)
+_CSV_ITEM = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
 
 class EditMetadataDialog(ctk.CTkToplevel):
     """
     A Toplevel window dialog for editing the metadata of a Power Query script.
+    Closing or saving only withdraws it; the owner can reuse it for the
+    next edit via load_script().
     """
 
     def __init__(self, parent, manager: PQManager, script_to_edit: PowerQueryScript, refresh_callback: Callable):
         super().__init__(parent)
         self.manager = manager
-        self.original_script = script_to_edit
         # Callback to refresh the main library view
         self.refresh_callback = refresh_callback
 
-        self.title(f"Edit: {self.original_script.meta.name}")
         self.geometry("700x700")
         self.transient(parent)  # Keep on top of parent
-        self.grab_set()      # Block interaction with parent
         self.configure(fg_color=SoP["BG"])
+        self.protocol("WM_DELETE_WINDOW", self._hide)
+        self._code_after_id = None  # Pending deferred set_code
 
         self._build_widgets()
+        self.load_script(script_to_edit)
+
+    def load_script(self, script: PowerQueryScript):
+        """Shows the dialog filled in for `script`."""
+        self.original_script = script
+        self.title(f"Edit: {script.meta.name}")
+        self._clear_form()
         self._prefill_form()
+        if self.state() == "withdrawn":
+            self.deiconify()
+        self.lift()
+        self.grab_set()  # Block interaction with parent
+
+    def _hide(self):
+        """Withdraws the dialog so the next edit skips rebuilding it."""
+        self.grab_release()
+        self.withdraw()
 
     def _build_widgets(self):
         """Builds the form elements for the dialog."""
@@ -37,12 +59,15 @@ class EditMetadataDialog(ctk.CTkToplevel):
         form_frame.pack(fill="both", expand=True, padx=15, pady=15)
         form_frame.grid_columnconfigure(1, weight=1)
 
+        # Shared by every form row
+        label_color = SoP["TEXT_DIM"]
+        entry_style = {"border_color": SoP["TREE_FIELD"],
+                       "fg_color": SoP["EDITOR"], "text_color": SoP["TEXT"]}
+
         def create_form_row(parent, label, row):
-            ctk.CTkLabel(parent, text=label, text_color=SoP["TEXT_DIM"]).grid(
+            ctk.CTkLabel(parent, text=label, text_color=label_color).grid(
                 row=row, column=0, sticky="w", padx=10, pady=8)
-            entry = ctk.CTkEntry(
-                parent, border_color=SoP["TREE_FIELD"],
-                fg_color=SoP["EDITOR"], text_color=SoP["TEXT"])
+            entry = ctk.CTkEntry(parent, **entry_style)
             entry.grid(row=row, column=1, sticky="ew", padx=10, pady=8)
             return entry
 
@@ -52,14 +77,12 @@ class EditMetadataDialog(ctk.CTkToplevel):
         self.entry_tags = create_form_row(form_frame, "Tags (csv)", 3)
 
         # Dependencies Row (with Auto-Detect)
-        ctk.CTkLabel(form_frame, text="Dependencies (csv)", text_color=SoP["TEXT_DIM"]).grid(
+        ctk.CTkLabel(form_frame, text="Dependencies (csv)", text_color=label_color).grid(
             row=4, column=0, sticky="w", padx=10, pady=8)
         dep_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
         dep_frame.grid(row=4, column=1, sticky="ew")
         dep_frame.grid_columnconfigure(0, weight=1)
-        self.entry_deps = ctk.CTkEntry(
-            dep_frame, border_color=SoP["TREE_FIELD"],
-            fg_color=SoP["EDITOR"], text_color=SoP["TEXT"])
+        self.entry_deps = ctk.CTkEntry(dep_frame, **entry_style)
         self.entry_deps.grid(row=0, column=0, sticky="ew", padx=(0, 10))
         auto_detect_btn = ctk.CTkButton(
             dep_frame, text="Auto-Detect", width=100,
@@ -91,9 +114,17 @@ class EditMetadataDialog(ctk.CTkToplevel):
             self, text="💾 Save Changes", height=40,
             command=self._on_save, fg_color=SoP["ACCENT"],
             hover_color=SoP["ACCENT_HOVER"], text_color="#000000",
-            font=ctk.CTkFont(weight="bold"))
+            font=get_font(weight="bold"))
         save_btn.pack(side="bottom", fill="x", padx=15, pady=15)
 
+    def _clear_form(self):
+        """Empties the editable fields before a new prefill."""
+        for entry in (self.entry_name, self.entry_category, self.entry_version,
+                      self.entry_tags, self.entry_deps):
+            entry.delete(0, "end")
+        self.text_desc.delete("1.0", "end")
+        self.code_view.set_code("")  # Don't show the previous query's code
+
     def _prefill_form(self):
         """Fills the form widgets with the original script data."""
         script = self.original_script
@@ -103,7 +134,14 @@ class EditMetadataDialog(ctk.CTkToplevel):
         self.entry_tags.insert(0, ", ".join(script.meta.tags))
         self.entry_deps.insert(0, ", ".join(script.meta.dependencies))
         self.text_desc.insert("1.0", script.meta.description)
-        self.code_view.set_code(script.body)  # Use the codeview's method
+        # Highlighting a long body is the slow part; let the form paint first
+        if self._code_after_id is not None:
+            self.after_cancel(self._code_after_id)
+        self._code_after_id = self.after(16, self._prefill_code)
+
+    def _prefill_code(self):
+        self._code_after_id = None
+        self.code_view.set_code(self.original_script.body)  # Use the codeview's method
 
     def _auto_detect_deps(self):
         """Auto-detects dependencies from the code view."""
@@ -134,10 +172,8 @@ class EditMetadataDialog(ctk.CTkToplevel):
             new_category = self.entry_category.get().strip() or "Uncategorized"
 
             # 2. Construct the new path
-            safe_name = "".join(c for c in new_name if c.isalnum()
-                                or c in (' ', '_', '-')).rstrip()
-            safe_category = "".join(c for c in new_category if c.isalnum() or c in (
-                ' ', '_', '-')).rstrip() or "Uncategorized"
+            safe_name = sanitize_name(new_name)
+            safe_category = sanitize_name(new_category, "Uncategorized")
             new_path = os.path.join(
                 self.manager.store.root, safe_category, f"{safe_name}.pq")
 
@@ -146,10 +182,8 @@ class EditMetadataDialog(ctk.CTkToplevel):
                 name=new_name,
                 category=new_category,
                 version=self.entry_version.get().strip() or "1.0",
-                tags=[t.strip()
-                      for t in self.entry_tags.get().split(",") if t.strip()],
-                dependencies=[d.strip()
-                              for d in self.entry_deps.get().split(",") if d.strip()],
+                tags=_CSV_ITEM.findall(self.entry_tags.get()),
+                dependencies=_CSV_ITEM.findall(self.entry_deps.get()),
                 description=self.text_desc.get("1.0", "end").strip(),
                 path=os.path.abspath(new_path)
             )
@@ -161,7 +195,7 @@ class EditMetadataDialog(ctk.CTkToplevel):
             # 5. Call the refresh callback provided by the parent view
             self.refresh_callback()
 
-            self.destroy()  # Close the dialog
+            self._hide()  # Close the dialog
 
         except Exception as e:
             messagebox.showerror(
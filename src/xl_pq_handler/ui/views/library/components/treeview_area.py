@@ -2,17 +2,39 @@ import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
 from typing import Callable, List, Tuple
-import pandas as pd
 
 from ....theme import SoP
 
+# Applies a flat list of (op, index, iid, values) to a treeview in one
+# Tcl call instead of one Python -> Tcl round trip per row
+_PLACE_ROWS_PROC = """
+proc ::xl_pq_place_rows {w rows} {
+    foreach {op index iid values} $rows {
+        switch -- $op {
+            insert {$w insert {} $index -id $iid -values $values}
+            move {$w move $iid {} $index}
+            values {$w item $iid -values $values}
+        }
+    }
+}
+"""
 
 class TreeviewArea(ctk.CTkFrame):
     """
     Component for the Treeview area in the Library view.
     Manages the tree, scrollbar, styling, and basic events.
+    Large result sets are attached in pages: the first page right
+    away, the rest as the user scrolls towards the end or, failing
+    that, in small idle-time batches.
+    Filtered-out rows are detached rather than deleted, so a new
+    filter only detaches/reattaches the rows that changed.
     """
 
+    FIRST_PAGE_ROWS = 200  # Rows inserted synchronously by populate()
+    PAGE_ROWS = 500        # Rows per lazily inserted page
+    PAGE_IDLE_MS = 30      # Delay between background pages
+    _style_applied = False  # ttk styles are app-wide; configure them once
+
     def __init__(self,
                  parent,
                  select_callback: Callable,   # Notify parent on selection
@@ -28,6 +50,14 @@ class TreeviewArea(ctk.CTkFrame):
         self.double_click_callback = double_click_callback
         self.enter_callback = enter_callback
 
+        self._pending_rows: List[Tuple[str, tuple]] = []  # (iid, values)
+        self._pending_pos = 0  # Next pending row to insert
+        self._page_after_id = None
+        # Every item in the tree (attached or detached) -> its values;
+        # also lets reads skip the Tcl round trip
+        self._values_by_iid: dict[str, Tuple[str, ...]] = {}
+        self._attached: List[str] = []  # Attached iids, in display order
+
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
@@ -53,7 +83,9 @@ class TreeviewArea(ctk.CTkFrame):
         # Scrollbar
         vsb = ctk.CTkScrollbar(self, orientation="vertical",
                                command=self.tree.yview, width=15, bg_color=SoP["TREE_FIELD"], fg_color=SoP["EDITOR"], corner_radius=8)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self.vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
+        self.tree.tk.eval(_PLACE_ROWS_PROC)
         vsb.pack(side="right", fill="y")  # Pack scrollbar first
         self.tree.pack(side="left", fill="both", expand=True)  # Then pack tree
 
@@ -68,7 +100,13 @@ class TreeviewArea(ctk.CTkFrame):
         self.tree.bind("<Control-A>", self._select_all_visible)
 
     def _apply_style(self):
-        """Applies ttk styling to the Treeview."""
+        """
+        Applies ttk styling to the Treeview. Styles are global to the
+        Tk app, so this runs once rather than per instance.
+        """
+        if TreeviewArea._style_applied:
+            return
+        TreeviewArea._style_applied = True
         style = ttk.Style()
         try:
             style.theme_use("clam")
@@ -84,23 +122,129 @@ class TreeviewArea(ctk.CTkFrame):
                   ("active", SoP["ACCENT_DARK"])])
         style.map("Treeview", background=[("selected", SoP["ACCENT"])])
 
-    def populate(self, data_frame: pd.DataFrame):
-        """Clears and fills the Treeview with data from a DataFrame."""
-        # Clear existing items
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+    def populate(self, display_rows: List[Tuple[tuple, str]]):
+        """
+        Shows the given rows, reusing existing tree items. Each row is
+        ((name, category, description, version), path), all strings.
+        """
+        self._cancel_pages()
 
-        # Insert new items
-        for _, row in data_frame.iterrows():
-            ver = row.get("version", "")
+        rows = []
+        used_iids = set()  # Tracked here instead of tree.exists()
+        for i, (values, path) in enumerate(display_rows):
             # Use name as IID, fallback to path if names collide (robustness)
-            iid = row["name"]
-            if self.tree.exists(iid):
-                # Use index as fallback part
-                iid = row.get("path", f"{row['name']}_{_}")
+            iid = values[0]
+            if iid in used_iids:
+                iid = path or f"{values[0]}_{i}"
+            used_iids.add(iid)
+            rows.append((iid, values))
+
+        # Keep at least as many rows attached as before, so narrowing a
+        # scrolled-through list doesn't detach rows only to page them back
+        limit = max(self.FIRST_PAGE_ROWS, len(self._attached))
+        self._sync_attached(rows[:limit])
+        self._pending_rows = rows
+        self._pending_pos = len(self._attached)
+        if not self._has_pending():
+            self._pending_rows = []
+            self._pending_pos = 0
+        self._schedule_page()
+
+    def _sync_attached(self, target: List[Tuple[str, tuple]]):
+        """
+        Makes the attached rows exactly `target`, in order. Rows that
+        stay keep their place, so narrowing a filter is one detach.
+        """
+        target_iids = {iid for iid, _ in target}
+        keep = [iid for iid in self._attached if iid in target_iids]
+        stale = [iid for iid in self._attached if iid not in target_iids]
+
+        # Kept rows must already be in target order (e.g. not after a
+        # re-sort); otherwise they're moved into place below. Moving an
+        # attached row reorders it, so they needn't be detached first
+        kept = set(keep)
+        if keep != [iid for iid, _ in target if iid in kept]:
+            kept = set()
+        if stale:
+            self.tree.detach(*stale)
+
+        ops = []
+        for index, (iid, values) in enumerate(target):
+            known = self._values_by_iid.get(iid)
+            if known is not None and known != values:
+                ops += ("values", index, iid, values)
+            self._values_by_iid[iid] = values  # Kept rows included
+            if iid in kept:
+                continue
+            ops += ("insert" if known is None else "move", index, iid, values)
+        self._place_rows(ops)
+        self._attached = [iid for iid, _ in target]
+
+    def _place_rows(self, ops: list):
+        """Runs the flat (op, index, iid, values) list in one Tcl call."""
+        if ops:
+            self.tree.tk.call("::xl_pq_place_rows", self.tree._w, ops)
+
+    def reset(self):
+        """Deletes every item, attached or not (after the data reloads)."""
+        self._cancel_pages()
+        if self._values_by_iid:
+            self.tree.delete(*self._values_by_iid)
+        self._values_by_iid = {}
+        self._attached = []
 
-            self.tree.insert("", "end", iid=iid, values=(
-                row["name"], row["category"], row.get("description", ""), ver))
+    def _insert_page(self, count: int):
+        """Attaches the next `count` pending rows to the tree."""
+        start = self._pending_pos
+        end = min(start + count, len(self._pending_rows))
+        ops = []
+        for iid, values in self._pending_rows[start:end]:
+            known = self._values_by_iid.get(iid)
+            if known is None:
+                ops += ("insert", "end", iid, values)
+            else:
+                if known != values:
+                    ops += ("values", "end", iid, values)
+                ops += ("move", "end", iid, values)
+            self._values_by_iid[iid] = values
+            self._attached.append(iid)
+        self._place_rows(ops)
+        self._pending_pos = end
+        if end >= len(self._pending_rows):
+            self._pending_rows = []
+            self._pending_pos = 0
+
+    def _has_pending(self) -> bool:
+        return self._pending_pos < len(self._pending_rows)
+
+    def _schedule_page(self):
+        if self._has_pending() and self._page_after_id is None:
+            self._page_after_id = self.after(
+                self.PAGE_IDLE_MS, self._run_scheduled_page)
+
+    def _run_scheduled_page(self):
+        self._page_after_id = None
+        self._insert_page(self.PAGE_ROWS)
+        self._schedule_page()
+
+    def _cancel_pages(self):
+        if self._page_after_id is not None:
+            self.after_cancel(self._page_after_id)
+            self._page_after_id = None
+        self._pending_rows = []
+        self._pending_pos = 0
+
+    def _flush_pages(self):
+        """Attaches every remaining row (for whole-list operations)."""
+        if self._has_pending():
+            self._insert_page(len(self._pending_rows))
+        self._cancel_pages()
+
+    def _on_tree_yscroll(self, first, last):
+        self.vsb.set(first, last)
+        # Scrolled near the end: attach the next page right away
+        if self._has_pending() and float(last) > 0.9:
+            self._insert_page(self.PAGE_ROWS)
 
     # --- Public methods for parent interaction ---
     def get_selection(self) -> Tuple[str, ...]:
@@ -109,19 +253,28 @@ class TreeviewArea(ctk.CTkFrame):
     def get_focused_item_name(self) -> str | None:
         focus = self.tree.focus()
         if focus:
-            return self.tree.item(focus, "values")[0]
+            return self.get_item_values(focus)[0]
         return None
 
     def get_item_values(self, iid: str) -> Tuple[str, ...]:
+        values = self._values_by_iid.get(iid)
+        if values is not None:
+            return values
         values = self.tree.item(iid, "values")
         if isinstance(values, tuple):
             return tuple(str(v) for v in values)
         else:
             return ()
 
+    def get_names_for(self, iids) -> List[str]:
+        """Query names for the given iids, in order (bulk get_item_values)."""
+        known = self._values_by_iid
+        return [known[iid][0] if iid in known else self.get_item_values(iid)[0]
+                for iid in iids]
+
     def clear_selection(self):
-        for sel in self.tree.selection():
-            self.tree.selection_remove(sel)
+        if self.tree.selection():
+            self.tree.selection_set(())  # One call, however many are selected
 
     def focus_first_item(self):
         children = self.tree.get_children()
@@ -136,6 +289,9 @@ class TreeviewArea(ctk.CTkFrame):
         if not focus:
             return "break"
         next_item = self.tree.next(focus)
+        if not next_item and self._has_pending():
+            self._insert_page(self.PAGE_ROWS)
+            next_item = self.tree.next(focus)
         if next_item:
             self.tree.selection_add(next_item)
             self.tree.focus(next_item)
@@ -156,6 +312,7 @@ class TreeviewArea(ctk.CTkFrame):
         return "break"
 
     def _select_all_visible(self, event):
+        self._flush_pages()
         children = self.tree.get_children()
         if children:
             self.tree.selection_set(children)
@@ -3,12 +3,20 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Callable
 import customtkinter as ctk
-import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 
-from ....classes import PQManager
+from ....classes import PQManager, PowerQueryScript
 from .components import EditMetadataDialog, TopBar, TreeviewArea, BottomPanel
-from ...theme import SoP
+from ...theme import SoP, get_font
+
+# Treeview column -> DataFrame column used for sorting
+_SORT_COLUMNS = {"Name": "name", "Category": "category",
+                 "Description": "description", "Version": "version"}
+# Shared tags/dependencies value for rows that have none
+_NO_ITEMS = ()
 
 
 class LibraryView(ctk.CTkFrame):
@@ -17,6 +25,12 @@ class LibraryView(ctk.CTkFrame):
     search, filters, and info panels.
     """
 
+    SEARCH_DEBOUNCE_MS = 150
+    SELECT_COALESCE_MS = 40  # Folds key-repeat selection bursts together
+    SELECTION_CACHE_SIZE = 128  # Scripts/dependency trees kept per session
+    INSERT_SUMMARY_MAX = 20  # Names listed in the insert-complete dialog
+    TRIGRAM_MIN_ROWS = 5000  # Libraries this big get a trigram search index
+
     def __init__(self, parent, manager: PQManager, refresh_callback: Callable):
         super().__init__(parent, fg_color="transparent")
         self.manager = manager
@@ -26,6 +40,31 @@ class LibraryView(ctk.CTkFrame):
         self.cat_vars = {}
         self.sort_column = "Name"
         self.sort_asc = True
+        self._sorted_pos = {}  # Sort column -> row positions in asc order
+        self._lc = {}  # Column -> lowercased search haystack array
+        self._trigrams: dict[str, set[int]] = {}  # Large libraries only
+        self._display_rows = []  # Per row: (tree values as str, path)
+        self._cat_codes = np.empty(0, dtype=np.intp)  # Row -> category index
+        # Applied category filter, read from cat_vars on Apply/reload only
+        self._chosen_cats: list[str] = []
+        self._cat_allowed = None  # Category index -> shown, or None for all
+        self._last_render_key = None  # Filter/sort state the tree shows
+        self._filter_key = None  # (query, categories) _filter_mask is for
+        self._filter_mask = None
+        # Per-name caches for selection rendering; cleared on refresh
+        self._script_cache: OrderedDict[str, PowerQueryScript] = OrderedDict()
+        self._tree_cache: OrderedDict[str, dict] = OrderedDict()
+        # Workbook listing (COM) and script/tree loads run off the UI thread
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pq-library")
+        # One warm worker for Excel inserts; also keeps them serialized
+        self._insert_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pq-insert")
+        self._select_req = 0  # Only the newest selection load may render
+        self._refresh_token = 0  # Only the newest data load may apply
+        self._select_pending = False  # A coalesced selection render is queued
+        self._rendered_selection = None  # Selection the panels last showed
+        self._populate_after_id = None  # Pending debounced search
         self.open_workbooks_for_insert = []
         self.refresh_callback = refresh_callback
 
@@ -64,13 +103,25 @@ class LibraryView(ctk.CTkFrame):
             category_popup_callback=self._open_category_popup  # Pass method for button click
         )
         self.top_bar.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        self.search_var.trace_add("write", lambda *a: self.populate_tree())
+        self.search_var.trace_add(
+            "write", lambda *a: self._schedule_populate())
+
+    def _schedule_populate(self):
+        """Debounces search keystrokes into a single repopulate."""
+        if self._populate_after_id is not None:
+            self.after_cancel(self._populate_after_id)
+        self._populate_after_id = self.after(
+            self.SEARCH_DEBOUNCE_MS, self._run_scheduled_populate)
+
+    def _run_scheduled_populate(self):
+        self._populate_after_id = None
+        self.populate_tree()
 
     def _build_treeview_area(self):
         """Builds the Treeview widget and its container."""
         self.treeview_area = TreeviewArea(
             parent=self,
-            select_callback=self._on_tree_select,  # Pass method for selection change
+            select_callback=self._schedule_select_render,  # Coalesced selection change
             sort_callback=self._sort_by_col,      # Pass method for sorting
             double_click_callback=self._on_double_click_insert,  # Pass method for double-click
             enter_callback=self._on_enter_insert  # Pass method for Enter key
@@ -85,7 +136,9 @@ class LibraryView(ctk.CTkFrame):
             insert_callback=self._threaded_insert_selected,  # Pass insert method
             clear_selection_callback=self.clear_selection,  # Pass clear method
             refresh_wb_list_callback=self._refresh_workbook_list_for_insert_wrapper,  # Pass wrapper
-            format_tree_string_callback=self._format_tree_string  # Pass helper
+            format_tree_string_callback=self._format_tree_string,  # Pass helper
+            dependency_tree_callback=self._get_dependency_tree,  # Cached trees
+            parse_executor=self._io_pool
         )
         self.bottom_panel.grid(row=2, column=0, sticky="nsew", pady=(10, 0))
         self._refresh_workbook_list_for_insert_wrapper()
@@ -137,8 +190,12 @@ class LibraryView(ctk.CTkFrame):
             messagebox.showerror("Error", f"Could not find script '{name}'")
             return
 
-        # --- Launch the Edit Dialog ---
-        dialog = EditMetadataDialog(
+        # --- Launch the Edit Dialog (reused once built) ---
+        dialog = getattr(self, "_edit_dialog", None)
+        if dialog is not None and dialog.winfo_exists():
+            dialog.load_script(script)
+            return
+        self._edit_dialog = EditMetadataDialog(
             parent=self,
             manager=self.manager,
             script_to_edit=script,
@@ -171,21 +228,126 @@ class LibraryView(ctk.CTkFrame):
             # Display the menu
             self.context_menu.post(event.x_root, event.y_root)
 
-    def _ensure_df_columns(self):
-        """Ensure dataframe has all expected columns after loading."""
-        if "tags" not in self.df.columns:
-            self.df["tags"] = [[] for _ in range(len(self.df))]
-        if "dependencies" not in self.df.columns:
-            self.df["dependencies"] = [[] for _ in range(len(self.df))]
+    @staticmethod
+    def _ensure_df_columns(df: pd.DataFrame):
+        """
+        Ensure dataframe has all expected columns after loading, with
+        sequence-valued tags/dependencies (never NaN) on every row.
+        Rows without any share one immutable empty tuple.
+        """
+        for col in ("tags", "dependencies"):
+            if col not in df.columns:
+                df[col] = [_NO_ITEMS] * len(df)
+            else:
+                df[col] = [v if isinstance(v, list) and v else _NO_ITEMS
+                           for v in df[col]]
+
+    @staticmethod
+    def _build_search_columns(df: pd.DataFrame) -> dict:
+        """Precomputes the lowercased search haystacks once per load."""
+        def lc_array(values) -> np.ndarray:
+            return np.strings.lower(np.array(
+                [str(v) for v in values], dtype=np.dtypes.StringDType()))
+
+        lc = {
+            col: lc_array(df[col])
+            for col in ("name", "category", "description")
+        }
+        # \x1f keeps a query from matching across two adjacent tags
+        lc["tags"] = lc_array("\x1f".join(map(str, ts)) for ts in df["tags"])
+        return lc
+
+    @staticmethod
+    def _build_sort_orders(df: pd.DataFrame) -> dict:
+        """Precomputes one stable ascending row order per sort column."""
+        return {
+            col: df[df_col].argsort(kind="stable").to_numpy()
+            for col, df_col in _SORT_COLUMNS.items()
+            if df_col in df.columns
+        }
+
+    @staticmethod
+    def _build_display_rows(df: pd.DataFrame) -> list:
+        """Stringifies the tree's column values once per load."""
+        def column(name):
+            if name in df.columns:
+                # object first: fillna("") on a Categorical (category)
+                # raises unless "" is one of its categories
+                return df[name].astype(object).fillna("").astype(str).tolist()
+            return [""] * len(df)
+        values = zip(*(column(c) for c in (
+            "name", "category", "description", "version")))
+        return list(zip(values, column("path")))
+
+    @staticmethod
+    def _build_trigram_index(lc: dict) -> dict[str, set[int]]:
+        """trigram -> positions of rows whose haystacks contain it."""
+        trigrams: dict[str, set[int]] = {}
+        # \x1e between columns: trigrams across them never match a query
+        for i, text in enumerate(map("\x1e".join, zip(*lc.values()))):
+            for j in range(len(text) - 2):
+                trigrams.setdefault(text[j:j + 3], set()).add(i)
+        return trigrams
+
+    def _search_candidates(self, q: str) -> np.ndarray | None:
+        """Rows containing every trigram of `q`, or None to scan all rows."""
+        if not self._trigrams or len(q) < 3:
+            return None
+        postings = sorted(
+            (self._trigrams.get(q[j:j + 3], set())
+             for j in range(len(q) - 2)), key=len)
+        rows = postings[0].intersection(*postings[1:])
+        return np.fromiter(sorted(rows), dtype=np.intp, count=len(rows))
 
     def refresh_data(self):
-        """Called by the main app to reload all data from the manager."""
+        """
+        Called by the main app to reload all data from the manager.
+        Loading runs on a worker; the view updates once it's done.
+        """
+        self._refresh_token += 1
+        token = self._refresh_token
+        self._io_pool.submit(self._load_library_data).add_done_callback(
+            lambda f: self.master.after(0, self._apply_library_data, token, f))
+
+    def _load_library_data(self) -> dict:
+        """THREAD TARGET: Loads the index and precomputes search/sort caches."""
+        # Use the manager's store to get the dataframe
+        df = self.manager.store.index_to_dataframe()
+        self._ensure_df_columns(df)
+        df["category"] = df["category"].fillna("Uncategorized")
+        lc = self._build_search_columns(df)
+        # Categorical: isin() and sorting work on integer codes
+        cats = df["category"].astype(str)
+        categories = sorted(cats.unique().tolist())
+        df["category"] = pd.Categorical(
+            cats, categories=categories, ordered=True)
+        return {"df": df, "categories": categories, "lc": lc,
+                "sorted_pos": self._build_sort_orders(df),
+                "display_rows": self._build_display_rows(df),
+                "cat_codes": df["category"].cat.codes.to_numpy(),
+                "trigrams": self._build_trigram_index(lc)
+                if len(df) >= self.TRIGRAM_MIN_ROWS else {}}
+
+    def _apply_library_data(self, token: int, future: Future):
+        """Swaps in freshly loaded data (UI thread)."""
+        if token != self._refresh_token:
+            return  # A newer refresh is already on its way
         try:
-            # Use the manager's store to get the dataframe
-            self.df = self.manager.store.index_to_dataframe()
-            self._ensure_df_columns()
-            self.df["category"] = self.df["category"].fillna("Uncategorized")
-            self.categories = sorted(self.df["category"].unique().tolist())
+            data = future.result()
+            self.df = data["df"]
+            self.categories = data["categories"]
+            self._lc = data["lc"]
+            self._sorted_pos = data["sorted_pos"]
+            self._trigrams = data["trigrams"]
+            self._display_rows = data["display_rows"]
+            self._cat_codes = data["cat_codes"]
+            self._script_cache.clear()
+            self._tree_cache.clear()
+            self._select_req += 1  # In-flight selection loads are now stale
+            self.bottom_panel.invalidate_caches()
+            self._last_render_key = None  # New data: always repopulate
+            self._filter_key = None
+            self.treeview_area.reset()  # Cached tree items may be stale
 
             # Preserve existing category selections
             new_cat_vars = {}
@@ -195,6 +357,7 @@ class LibraryView(ctk.CTkFrame):
                 else:
                     new_cat_vars[c] = tk.BooleanVar(value=True)
             self.cat_vars = new_cat_vars
+            self._read_category_filter()
 
             self.populate_tree()
             self._update_category_summary()
@@ -203,16 +366,25 @@ class LibraryView(ctk.CTkFrame):
             self.df = pd.DataFrame()  # Clear df on error
 
     def _open_category_popup(self):
-        if hasattr(self, "_cat_popup") and self._cat_popup.winfo_exists():
-            self._cat_popup.lift()
-            return
+        popup = getattr(self, "_cat_popup", None)
+        if popup is not None and popup.winfo_exists():
+            if self._cat_popup_categories == self.categories:
+                # Reuse it; its checkboxes are bound to the live cat_vars
+                if popup.state() == "withdrawn":
+                    popup.deiconify()
+                    popup.grab_set()
+                popup.lift()
+                return
+            popup.destroy()  # The category set changed since it was built
         popup = ctk.CTkToplevel(self)
         popup.title("Select Categories")
         popup.geometry("420x440")
         popup.transient()
         popup.grab_set()
         popup.configure(fg_color=SoP["BG"])
+        popup.protocol("WM_DELETE_WINDOW", lambda: self._hide_popup(popup))
         self._cat_popup = popup
+        self._cat_popup_categories = list(self.categories)
         frame = ctk.CTkScrollableFrame(popup, fg_color=SoP["FRAME"])
         frame.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -229,7 +401,7 @@ class LibraryView(ctk.CTkFrame):
             btn_frame, text="Apply",
             command=lambda: self._apply_category_selection(popup),
             fg_color=SoP["ACCENT"], hover_color=SoP["ACCENT_HOVER"],
-            text_color="#000000", font=ctk.CTkFont(weight="bold"))
+            text_color="#000000", font=get_font(weight="bold"))
         apply_btn.pack(side="right", padx=(6, 0))
         ctk.CTkButton(
             btn_frame, text="All", width=80,
@@ -248,8 +420,18 @@ class LibraryView(ctk.CTkFrame):
     def _clear_all_categories(self): [v.set(False)
                                       for v in self.cat_vars.values()]
 
+    def _read_category_filter(self):
+        """Snapshots the checked categories as the applied filter."""
+        self._chosen_cats = [c for c in self.categories if self.cat_vars[c].get()]
+        if self._chosen_cats and len(self._chosen_cats) != len(self.categories):
+            chosen = set(self._chosen_cats)
+            # Per-category flags, gathered by each row's category code
+            self._cat_allowed = np.array([c in chosen for c in self.categories])
+        else:
+            self._cat_allowed = None
+
     def _update_category_summary(self):
-        chosen = [c for c, v in self.cat_vars.items() if v.get()]
+        chosen = self._chosen_cats
         summary_text = "All categories"
         button_text = "Categories ▾"
 
@@ -265,67 +447,135 @@ class LibraryView(ctk.CTkFrame):
         self.top_bar.update_button_text(button_text)
 
     def _apply_category_selection(self, popup):
+        self._read_category_filter()
         self._update_category_summary()
         if popup:
-            popup.destroy()
+            self._hide_popup(popup)
         self.populate_tree()
 
+    def _hide_popup(self, popup):
+        """Withdraws the popup so the next open skips rebuilding it."""
+        popup.grab_release()
+        popup.withdraw()
+
     def populate_tree(self, *_):
         if self.df.empty:
             return
 
         q = (self.search_var.get() or "").strip().lower()
-        chosen = set([c for c, v in self.cat_vars.items() if v.get()])
-        dff = self.df.copy()
+        # Same filter and sort as what's shown (e.g. typed then deleted)
+        render_key = (q, tuple(self._chosen_cats),
+                      self.sort_column, self.sort_asc)
+        if render_key == self._last_render_key:
+            return
 
-        if chosen and len(chosen) != len(self.categories):
-            dff = dff[dff["category"].isin(chosen)]
+        # A header click keeps the filter, so reuse the last mask
+        filter_key = render_key[:2]
+        if filter_key != self._filter_key:
+            self._filter_mask = self._build_filter_mask(q)
+            self._filter_key = filter_key
+        mask = self._filter_mask
+
+        # Filtering keeps order, so gathering the kept rows from a
+        # presorted order avoids a full sort on every keystroke
+        order = self._sorted_pos.get(
+            self.sort_column, self._sorted_pos["Name"])
+        if not self.sort_asc:
+            order = order[::-1]
+        rows = self._display_rows
+        self.treeview_area.populate([rows[i] for i in order[mask[order]]])
+        self._last_render_key = render_key
+
+        # Kept rows may still be selected; clear only if there's anything
+        # to clear, else the panels already show the empty state
+        if self._rendered_selection or self.treeview_area.get_selection():
+            self.clear_selection()
+
+    def _build_filter_mask(self, q: str) -> np.ndarray:
+        """Rows passing the applied category filter and the search `q`."""
+        # One boolean mask over the full frame; no per-keystroke copy
+        mask = np.ones(len(self.df), dtype=bool)
+
+        if self._cat_allowed is not None:
+            mask &= self._cat_allowed[self._cat_codes]
 
         if q:
-            def _row_matches(r):
-                if q in str(r["name"]).lower():
-                    return True
-                if q in str(r["category"]).lower():
-                    return True
-                if q in str(r["description"]).lower():
-                    return True
-                tags = r.get("tags")
-                if isinstance(tags, list):
-                    if any(q in str(tag).lower() for tag in tags):
-                        return True
-                return False
-            dff = dff[dff.apply(_row_matches, axis=1)]
-
-        col_map = {"Name": "name", "Category": "category",
-                   "Description": "description", "Version": "version"}
-
-        sort_col_df = col_map.get(self.sort_column, "name")
-        if sort_col_df not in dff.columns:
-            sort_col_df = "name"
-
-        dff = dff.sort_values(by=sort_col_df, ascending=self.sort_asc)
-
-        self.treeview_area.populate(dff)
-
-        count = len(self.treeview_area.get_selection())
-        self.bottom_panel.update_selection_count(count)
-        self.clear_selection()
+            hit = np.zeros(len(self.df), dtype=bool)
+            rows = self._search_candidates(q)
+            if rows is None:
+                for haystack in self._lc.values():
+                    hit |= np.strings.find(haystack, q) >= 0
+            elif len(rows):
+                # Trigram hits can be false positives; verify just those
+                found = np.zeros(len(rows), dtype=bool)
+                for haystack in self._lc.values():
+                    found |= np.strings.find(haystack[rows], q) >= 0
+                hit[rows[found]] = True
+            mask &= hit
+        return mask
 
     # --- Selection & Sorting ---
     def _format_tree_string(self, node: dict, indent: str = "") -> str:
-        """Recursively formats the dependency tree dict into a string."""
-        tree_str = f"{indent}• {node['name']}\n"
-
-        children = node.get("children", [])
-        for i, child in enumerate(children):
-            is_last = (i == len(children) - 1)
-            child_indent = indent + ("    " if is_last else "│   ")
-            tree_str += self._format_tree_string(child, child_indent)
-        return tree_str
+        """Formats the dependency tree dict into a string (iteratively)."""
+        lines = []
+        stack = [(node, indent)]
+        while stack:
+            current, current_indent = stack.pop()
+            lines.append(f"{current_indent}• {current['name']}\n")
+            children = current.get("children", [])
+            last = len(children) - 1
+            # Push in reverse so children pop in their original order
+            for i in range(last, -1, -1):
+                child_indent = current_indent + (
+                    "    " if i == last else "│   ")
+                stack.append((children[i], child_indent))
+        return "".join(lines)
+
+    def _cached(self, cache: OrderedDict, name: str, load: Callable):
+        """LRU lookup; misses call load(name) and keep non-None results."""
+        if name in cache:
+            cache.move_to_end(name)
+            return cache[name]
+        value = load(name)
+        self._remember(cache, name, value)
+        return value
+
+    def _remember(self, cache: OrderedDict, name: str, value):
+        if value is not None:
+            cache[name] = value
+            if len(cache) > self.SELECTION_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _get_script(self, name: str) -> PowerQueryScript | None:
+        return self._cached(self._script_cache, name, self.manager.get_script)
+
+    def _get_dependency_tree(self, name: str) -> dict:
+        return self._cached(
+            self._tree_cache, name, self.manager.resolver.get_dependency_tree)
+
+    def _schedule_select_render(self):
+        """
+        Queues one _on_tree_select for a burst of selection events
+        (held Shift+Arrow fires both the key handler and
+        <<TreeviewSelect>> at key-repeat rate).
+        """
+        if self._select_pending:
+            return
+        self._select_pending = True
+        self.after(self.SELECT_COALESCE_MS, self._run_select_render)
+
+    def _run_select_render(self):
+        self._select_pending = False
+        # <<TreeviewSelect>> also arrives after bulk tree updates (detach,
+        # clear_selection) whose panels were already rendered directly
+        if self.treeview_area.get_selection() == self._rendered_selection:
+            return
+        self._on_tree_select()
 
     def _on_tree_select(self, event=None):
         """Main handler for Treeview selection changes."""
         selected_iids = self.treeview_area.get_selection()
+        self._rendered_selection = selected_iids
         self.bottom_panel.update_selection_count(len(selected_iids))
 
         # Update description panel (handles multi-select)
@@ -334,11 +584,43 @@ class LibraryView(ctk.CTkFrame):
         self.bottom_panel.update_description(item_values_list)
 
         # Update panels that require single selection
-        script = None
-        if len(selected_iids) == 1:
-            name = self.treeview_area.get_item_values(selected_iids[0])[0]
-            script = self.manager.get_script(name)
-            # Handle script not found if necessary (maybe inside update_single_selection_tabs)
+        self._select_req += 1
+        if len(selected_iids) != 1:
+            self.bottom_panel.update_single_selection_tabs(None)
+            return
+        name = item_values_list[0][0]  # Already resolved for the description
+        if name in self._script_cache and name in self._tree_cache:
+            self.bottom_panel.update_single_selection_tabs(
+                self._get_script(name))
+            return
+
+        # Cache miss: read the file and walk the graph on a worker
+        req = self._select_req
+        self._io_pool.submit(self._load_selection, name).add_done_callback(
+            lambda f: self.master.after(0, self._apply_selection, req, name, f))
+
+    def _load_selection(self, name: str):
+        """THREAD TARGET: Loads the script and dependency tree for `name`."""
+        script = self.manager.get_script(name)
+        tree = None
+        if script:
+            try:
+                tree = self.manager.resolver.get_dependency_tree(name)
+            except Exception:
+                pass  # The Graph tab retries and shows the error
+        return script, tree
+
+    def _apply_selection(self, req: int, name: str, future: Future):
+        """Caches and renders a finished selection load if still current."""
+        try:
+            script, tree = future.result()
+        except Exception as e:
+            print(f"Could not load query '{name}': {e}")
+            script, tree = None, None
+        if req != self._select_req:
+            return  # Superseded (or the index was refreshed meanwhile)
+        self._remember(self._script_cache, name, script)
+        self._remember(self._tree_cache, name, tree)
         self.bottom_panel.update_single_selection_tabs(script)
 
     def clear_selection(self):
@@ -346,6 +628,10 @@ class LibraryView(ctk.CTkFrame):
         self._on_tree_select()
 
     def _focus_first_result(self):
+        if self._populate_after_id is not None:
+            # Enter beat the debounce; apply the latest search first
+            self.after_cancel(self._populate_after_id)
+            self._run_scheduled_populate()
         self.treeview_area.focus_first_item()
         self._on_tree_select()
 
@@ -378,28 +664,37 @@ class LibraryView(ctk.CTkFrame):
                 messagebox.showwarning(
                     "No selection", "Please select functions.")
                 return
-            actual_names = [self.treeview_area.get_item_values(
-                iid)[0] for iid in selected_iids]
+            actual_names = self.treeview_area.get_names_for(selected_iids)
 
         if not actual_names:
             return
         workbook_name_arg = self.bottom_panel.get_selected_workbook_target()
 
-        threading.Thread(
-            target=self.insert_selected_functions,
-            args=(actual_names, workbook_name_arg),
-            daemon=True
-        ).start()
+        self._insert_pool.submit(
+            self.insert_selected_functions, actual_names, workbook_name_arg)
 
     def _refresh_workbook_list_for_insert_wrapper(self):
-        """Gets workbook names and tells BottomPanel to update."""
+        """Gets workbook names off the UI thread, then updates BottomPanel."""
+        self._io_pool.submit(self._list_open_workbooks).add_done_callback(
+            lambda f: self.master.after(0, self._apply_workbook_list, f))
+
+    def _list_open_workbooks(self) -> list[str]:
+        """THREAD TARGET: Lists open workbooks inside this thread's COM apartment."""
+        with self.manager.excel.com_apartment():
+            return self.manager.excel.list_open_workbooks()
+
+    def _apply_workbook_list(self, future: Future):
         try:
-            names = self.manager.excel.list_open_workbooks()
-            self.bottom_panel.update_workbook_list(names)
+            names = future.result()
         except Exception as e:
             print(f"Could not refresh workbook list for insert: {e}")
-            self.bottom_panel.update_workbook_list(
-                [])  # Update with empty list on error
+            names = []  # Update with empty list on error
+        self.bottom_panel.update_workbook_list(names)
+
+    def close(self):
+        """Stops accepting work and drops queued jobs (called on app exit)."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._insert_pool.shutdown(wait=False, cancel_futures=True)
 
     def insert_selected_functions(self, names: list[str], workbook_name: str | None):
         """
@@ -407,12 +702,16 @@ class LibraryView(ctk.CTkFrame):
         Uses the new manager API with try/except.
         """
         try:
-            self.manager.insert_into_excel(
-                names=names, workbook_name=workbook_name)
+            with self.manager.excel.com_apartment():
+                self.manager.insert_into_excel(
+                    names=names, workbook_name=workbook_name)
 
             target_desc = workbook_name if workbook_name else "the active workbook"
             summary = f"✅ Successfully Inserted {len(names)} Queries (and dependencies) into:\n{target_desc}"
-            summary += "\n".join(f"  - {name}" for name in names)
+            shown = names[:self.INSERT_SUMMARY_MAX]
+            summary += "\n" + "\n".join(f"  - {name}" for name in shown)
+            if len(names) > len(shown):
+                summary += f"\n  ... and {len(names) - len(shown)} more"
 
             self.master.after(0, lambda: messagebox.showinfo(
                 "Insertion Complete", summary))
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from xl_pq_handler.ui.views.library.view import LibraryView
+
+
+class _Store:
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    def index_to_dataframe(self) -> pd.DataFrame:
+        return self.df.copy()
+
+
+def _load(df: pd.DataFrame) -> dict:
+    """Runs LibraryView's worker-side load without building any widgets."""
+    view = LibraryView.__new__(LibraryView)
+    view.manager = SimpleNamespace(store=_Store(df))
+    return view._load_library_data()
+
+
+def _index_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "name": ["Alpha", "beta", "Gamma"],
+        "category": ["Cat1", "Cat2", None],
+        "description": ["hello", None, "world"],
+        "version": ["1.0", "1.1", None],
+        "path": ["/a.pq", "/b.pq", "/c.pq"],
+        "tags": [["x"], [], None],
+    })
+
+
+def test_display_rows_with_categorical_category():
+    data = _load(_index_frame())
+
+    assert isinstance(data["df"]["category"].dtype, pd.CategoricalDtype)
+    assert data["categories"] == ["Cat1", "Cat2", "Uncategorized"]
+    assert data["display_rows"] == [
+        (("Alpha", "Cat1", "hello", "1.0"), "/a.pq"),
+        (("beta", "Cat2", "", "1.1"), "/b.pq"),
+        (("Gamma", "Uncategorized", "world", ""), "/c.pq"),
+    ]
+
+
+def test_display_rows_from_categorical_input():
+    df = _index_frame()
+    df["category"] = pd.Categorical(df["category"])
+
+    rows = LibraryView._build_display_rows(df)
+
+    assert [values[1] for values, _ in rows] == ["Cat1", "Cat2", ""]
+
+
+def test_rows_without_items_share_one_sentinel():
+    df = _index_frame()  # tags: ["x"], [], None; no dependencies column
+
+    LibraryView._ensure_df_columns(df)
+
+    assert df["tags"][0] == ["x"]
+    assert df["tags"][1] is df["tags"][2] is df["dependencies"][0]
+    assert len({id(v) for v in df["dependencies"]}) == 1
@@ -0,0 +1,11 @@
+from xl_pq_handler.classes.pq_manager.utils import sanitize_name
+
+
+def test_sanitize_name_drops_unsafe_chars():
+    assert sanitize_name("Sales/Q1: Net (v2) ") == "SalesQ1 Net v2"
+    assert sanitize_name("my_query-01") == "my_query-01"
+
+
+def test_sanitize_name_default_when_empty():
+    assert sanitize_name("???", "Uncategorized") == "Uncategorized"
+    assert sanitize_name("") == ""